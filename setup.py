@@ -10,6 +10,7 @@ setup(name='tap-linkedin-ads',
       py_modules=['tap_linkedin_ads'],
       install_requires=[
           'backoff==2.2.1',
+          'orjson==3.8.3',
           'requests==2.32.3',
           'singer-python==6.1.0'
       ],
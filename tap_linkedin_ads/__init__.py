@@ -3,7 +3,10 @@
 import sys
 import json
 import argparse
+from decimal import Decimal
+import orjson
 import singer
+import singer.messages
 from singer import metadata, utils
 from tap_linkedin_ads.client import LinkedinClient, REQUEST_TIMEOUT
 from tap_linkedin_ads.discover import discover as _discover
@@ -20,6 +23,26 @@ REQUIRED_CONFIG_KEYS = [
 ]
 
 
+def serialize_default(value):
+    """
+    Serialize the values orjson does not support natively.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+def format_message(message, ensure_ascii=True):
+    """
+    Format a Singer message with orjson instead of simplejson, it is called for every record written.
+    orjson cannot escape non-ASCII characters, so messages with some are formatted with json if ensure_ascii is true.
+    """
+    formatted = orjson.dumps(message.asdict(), default=serialize_default).decode('utf-8')
+    if ensure_ascii and not formatted.isascii():
+        return json.dumps(message.asdict(), default=serialize_default, separators=(',', ':'))
+    return formatted
+
+
 def do_discover(client, config):
     LOGGER.info('Starting discover')
     client.check_accounts(config)
@@ -49,6 +72,7 @@ def main():
         if parsed_args.discover:
             do_discover(client, config)
         elif parsed_args.catalog:
+            singer.messages.format_message = format_message
             _sync(client=client,
                   config=config,
                   catalog=parsed_args.catalog,
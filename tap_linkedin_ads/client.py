@@ -2,19 +2,28 @@ from datetime import datetime, timedelta
 import time
 import json
 import backoff
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from singer import metrics
 import singer
 
 LOGGER = singer.get_logger()
-BASE_URL = 'https://api.linkedin.com/rest'
+API_HOST_URL = 'https://api.linkedin.com'
+BASE_URL = API_HOST_URL + '/rest'
 LINKEDIN_TOKEN_URI = 'https://www.linkedin.com/oauth/v2/accessToken'
 INTROSPECTION_URI = 'https://www.linkedin.com/oauth/v2/introspectToken'
 LINKEDIN_VERSION = '202501'
 
 # set default timeout of 300 seconds
 REQUEST_TIMEOUT = 300
+# Max number of kept-alive connections to a host, enough for the accounts synced concurrently,
+# each fetching several analytics field chunks at the same time.
+# It is also a hard cap of concurrent requests to the API host, to stay clear of the rate limits.
+POOL_MAXSIZE = 32
+# Number of hosts (API, OAuth) whose connection pools are kept
+POOL_CONNECTIONS = 16
 
 class LinkedInError(Exception):
     pass
@@ -140,6 +149,15 @@ class LinkedinClient: # pylint: disable=too-many-instance-attributes
         self.__accounts = accounts
         self.__expires = None
         self.__session = requests.Session()
+        # Every request of the sync goes through this session, so the connections are kept alive
+        # and reused instead of paying a TCP and TLS handshake for each page.
+        self.__session.mount('https://', HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                                     pool_maxsize=POOL_MAXSIZE))
+        # All the sync threads share this session, the API host gets its own pool which makes the
+        # threads wait for a free connection instead of opening more than POOL_MAXSIZE of them.
+        self.__session.mount(API_HOST_URL, HTTPAdapter(pool_connections=1,
+                                                       pool_maxsize=POOL_MAXSIZE,
+                                                       pool_block=True))
         self.__base_url = None
         # if request_timeout is other than 0,"0" or "" then use request_timeout
         if request_timeout and float(request_timeout):
@@ -340,7 +358,7 @@ class LinkedinClient: # pylint: disable=too-many-instance-attributes
     def request(self, method, url=None, path=None, **kwargs):
 
         if not url and self.__base_url is None:
-            self.__base_url = 'https://api.linkedin.com/rest'
+            self.__base_url = BASE_URL
 
         if not url and path:
             url = '{}/{}'.format(self.__base_url, path)
@@ -382,7 +400,8 @@ class LinkedinClient: # pylint: disable=too-many-instance-attributes
 
         if response.status_code != 200:
             raise_for_error(response)
-        return response.json()
+        # orjson parses the large analytics pages considerably faster than the stdlib json
+        return orjson.loads(response.content)
 
     def get(self, url=None, path=None, **kwargs):
         return self.request('GET', url=url, path=path, **kwargs)
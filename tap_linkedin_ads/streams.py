@@ -1,13 +1,15 @@
 import urllib.parse
 import re
-import copy
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 from datetime import timedelta
 import singer
 from singer import metrics, metadata, utils
 from singer import Transformer, should_sync_field, UNIX_MILLISECONDS_INTEGER_DATETIME_PARSING
 from singer.utils import strptime_to_utc, strftime
-from tap_linkedin_ads.transform import transform_json, snake_case_to_camel_case
+from tap_linkedin_ads.transform import transform_records, snake_case_to_camel_case
 from tap_linkedin_ads.urn_resolver import resolve_urns
 import json
 
@@ -25,6 +27,9 @@ def batch_resolve_urns(client, urns, endpoint, name_path, locale=None):
     """
     return resolve_urns(client, urns, endpoint, locale)
 
+# Fields requested with every chunk of analytics fields, these build the primary key of the records
+ANALYTICS_KEY_FIELDS = ['dateRange', 'pivotValues']
+
 # Below fields are a list of foreign keys(primary key of a parent) and replication keys that API can not accept in the parameters.
 # We will skip these fields while passing selected fields in the API parameters.
 FIELDS_UNAVAILABLE_FOR_AD_ANALYTICS = {
@@ -40,7 +45,8 @@ FIELDS_UNAVAILABLE_FOR_AD_ANALYTICS = {
     'pivotValueName'  # This field is not available in the API schema
 }
 
-ANALYTICS_STREAMS = [
+# Stream name collections below are only used for membership checks
+ANALYTICS_STREAMS = frozenset({
     "ad_analytics_by_campaign",
     "ad_analytics_by_creative",
     "ad_analytics_by_member_company_size",
@@ -52,26 +58,70 @@ ANALYTICS_STREAMS = [
     "ad_analytics_by_member_region_v2",
     "ad_analytics_by_member_company",
     "ad_analytics_by_placement_name"
-]
+})
 
-CURSOR_BASED_PAGINATION_STREAMS = ["accounts", "campaign_groups", "campaigns", "creatives"]
-NEW_PATH_STREAMS = ["campaign_groups", "campaigns", "creatives"]
+CURSOR_BASED_PAGINATION_STREAMS = frozenset({"accounts", "campaign_groups", "campaigns", "creatives"})
+NEW_PATH_STREAMS = frozenset({"campaign_groups", "campaigns", "creatives"})
 BASE_URL = 'https://api.linkedin.com/rest'
+# Characters which are not percent-encoded when building the query string of a request,
+# `{}` keeps the campaigns placeholder of the creatives params as it is
+URL_SAFE_CHARS = '():,%[]{}'
+# Matches the cursor of the current page in the URL of a cursor based paginated stream
+PAGE_TOKEN_REGEX = re.compile(r'pageToken=[^&]+')
+# Max number of accounts synced at the same time by a stream with an account specific path
+MAX_ACCOUNT_WORKERS = 8
+# Serializes the Singer messages written to stdout by the account workers
+WRITE_LOCK = threading.Lock()
+# Serializes the updates of the child stream bookmarks shared by the account workers
+BOOKMARK_LOCK = threading.Lock()
+# Max number of field chunks of an analytics window requested at the same time. Kept low as
+# the analytics of several accounts can be synced concurrently.
+MAX_CHUNK_WORKERS = 4
+# DAILY analytics windows with fewer records than SPARSE_WINDOW_RECORDS are followed by a window
+# twice as long, up to MAX_DAILY_WINDOW_DAYS, and ones with more than DENSE_WINDOW_RECORDS by a
+# window half as long, to stay well under the 10000 records of a single page.
+SPARSE_WINDOW_RECORDS = 2000
+DENSE_WINDOW_RECORDS = 8000
+MAX_DAILY_WINDOW_DAYS = 90
 
 def write_bookmark(state, value, stream_name):
     """
     Write the bookmark in the state corresponding to the stream.
+    The state is only updated in memory, call `flush_state` to emit it.
     """
     if 'bookmarks' not in state:
         state['bookmarks'] = {}
     state['bookmarks'][stream_name] = value
     LOGGER.info('Write state for stream: %s, value: %s', stream_name, value)
-    singer.write_state(state)
+
+def flush_state(state):
+    """
+    Emit the current state, including all bookmarks written since the last flush.
+    """
+    with WRITE_LOCK:
+        singer.write_state(state)
+
+def update_child_bookmark(child_max_bookmarks, child_stream_name, bookmark_value):
+    """
+    Update the max bookmark of the child stream if the bookmark value is greater.
+    """
+    bookmark_dttm = strptime_to_utc(bookmark_value)
+    with BOOKMARK_LOCK:
+        if bookmark_dttm > strptime_to_utc(child_max_bookmarks[child_stream_name]):
+            child_max_bookmarks[child_stream_name] = strftime(bookmark_dttm)
+
+# Selected fields of each stream, keyed by tap_stream_id. The catalog does not change
+# during a sync, so the fields are only computed once for each catalog entry.
+SELECTED_FIELDS_CACHE = {}
 
 def selected_fields(catalog_for_stream):
     """
     Get all selected fields of given streams
     """
+    cached_entry = SELECTED_FIELDS_CACHE.get(catalog_for_stream.tap_stream_id)
+    if cached_entry and cached_entry[0] is catalog_for_stream:
+        return cached_entry[1]
+
     mdata = metadata.to_map(catalog_for_stream.metadata)
     fields = catalog_for_stream.schema.properties.keys()
 
@@ -82,6 +132,7 @@ def selected_fields(catalog_for_stream):
         if should_sync_field(field_metadata.get('inclusion'), field_metadata.get('selected')):
             selected_fields_list.append(field)
 
+    SELECTED_FIELDS_CACHE[catalog_for_stream.tap_stream_id] = (catalog_for_stream, selected_fields_list)
     return selected_fields_list
 
 def split_into_chunks(fields, chunk_length):
@@ -92,25 +143,40 @@ def split_into_chunks(fields, chunk_length):
     Args: fields = [1, 2, 3, 4, 5], chunk_length = 2
     Return: [[1, 2], [3, 4], [5]]
     """
-    return (fields[x:x+chunk_length] for x in range(0, len(fields), chunk_length))
+    return [fields[x:x+chunk_length] for x in range(0, len(fields), chunk_length)]
+
+def collect_parent_ids(records, parent_ids_by_key):
+    """
+    Yield the records unchanged while collecting the values of the given foreign keys.
+    Example:
 
-def sync_analytics_endpoint(client, stream_name, path, query_string):
+    Args: records = [{'id': 1}, {'id': 2}], parent_ids_by_key = {'id': []}
+    Result: parent_ids_by_key = {'id': [1, 2]}
     """
-    Call API for analytics endpoint and return all pages of records.
+    for record in records:
+        for key, parent_ids in parent_ids_by_key.items():
+            parent_ids.append(record.get(key))
+        yield record
+
+def sync_analytics_endpoint(client, stream_name, path, params):
+    """
+    Call API for analytics endpoint with the query params and return all pages of records.
     """
     page = 1
-    next_url = 'https://api.linkedin.com/rest/{}?{}'.format(path, query_string)
+    query_string = urllib.parse.urlencode(params, safe=URL_SAFE_CHARS)
+    next_url = '{}/{}?{}'.format(BASE_URL, path, query_string)
 
     # Loop until the last page
     while next_url:
-        LOGGER.info('URL for %s: %s', stream_name, next_url)
+        # Called for every field chunk of every window, the window itself is logged at INFO level
+        LOGGER.debug('URL for %s: %s', stream_name, next_url)
 
         data = client.get(url=next_url, endpoint=stream_name)
         yield data
         # Fetch next page
         next_url = get_next_url(stream_name, next_url, data)
 
-        LOGGER.info('%s: Synced page %s', stream_name, page)
+        LOGGER.debug('%s: Synced page %s', stream_name, page)
         page = page + 1
 
 def get_next_url(stream_name, next_url, data):
@@ -121,7 +187,7 @@ def get_next_url(stream_name, next_url, data):
         next_page_token = data.get('metadata', {}).get('nextPageToken', None)
         if next_page_token:
             if 'pageToken=' in next_url:
-                next_url = re.sub(r'pageToken=[^&]+', 'pageToken={}'.format(next_page_token), next_url)
+                next_url = PAGE_TOKEN_REGEX.sub('pageToken={}'.format(next_page_token), next_url)
             else:
                 next_url = next_url + "&pageToken={}".format(next_page_token)
         else:
@@ -143,6 +209,16 @@ def get_next_url(stream_name, next_url, data):
                     next_url = 'https://api.linkedin.com{}'.format(urllib.parse.unquote(href))
     return next_url
 
+def next_window_size(window_size, record_count, max_window_size):
+    """
+    Return the size in days of the next analytics window, from the record count of the last window.
+    """
+    if record_count < SPARSE_WINDOW_RECORDS:
+        return min(window_size * 2, max_window_size)
+    if record_count > DENSE_WINDOW_RECORDS:
+        return max(window_size // 2, 1)
+    return window_size
+
 def shift_sync_window(params, today, date_window_size, forced_window_size=None):
     """
     Move ahead date window by date_window_size and update params with the new date window.
@@ -164,6 +240,42 @@ def shift_sync_window(params, today, date_window_size, forced_window_size=None):
                   'dateRange.end.year': new_end.year,}
     return current_end, new_end, new_params
 
+# Resolution configs for the analytics streams whose pivot values are resolved to names
+RESOLUTION_CONFIGS = MappingProxyType({
+    "ad_analytics_by_member_country_v2": {
+        "endpoint": "geo",
+        "locale": "(language:en,country:US)"
+    },
+    "ad_analytics_by_member_region_v2": {
+        "endpoint": "geo",
+        "locale": "(language:en,country:US)"
+    },
+    "ad_analytics_by_member_job_function": {
+        "endpoint": "functions",
+        "name_path": ['name', 'localized', 'en_US'],
+        "locale": "en_US"
+    },
+    "ad_analytics_by_member_job_title": {
+        "endpoint": "titles",
+        "name_path": ['name', 'localized', 'en_US'],
+        "locale": "en_US"
+    },
+    "ad_analytics_by_member_industry": {
+        "endpoint": "industries",
+        "name_path": ['name', 'localized', 'en_US'],
+        "locale": "(language:en,country:US)"
+    },
+    "ad_analytics_by_member_company": {
+        "endpoint": "organizations",
+        "name_path": ['name', 'localized', 'en_US']
+    },
+    "ad_analytics_by_member_seniority": {
+        "endpoint": "seniorities",
+        "name_path": ["name", "localized", "en_US"],
+        "locale": None
+    },
+})
+
 def merge_responses(pivot, data, client=None, stream_name=None):
     """
     Prepare map with key as primary key and value as the record itself for analytics streams.
@@ -173,42 +285,10 @@ def merge_responses(pivot, data, client=None, stream_name=None):
     full_records = {}
     urns_to_resolve = set()
     
-    # Define resolution configs for different streams
-    resolution_configs = {
-        "ad_analytics_by_member_country_v2": {
-            "endpoint": "geo",
-            "locale": "(language:en,country:US)"
-        },
-        "ad_analytics_by_member_region_v2": {
-            "endpoint": "geo",
-            "locale": "(language:en,country:US)"
-        },
-        "ad_analytics_by_member_job_function": {
-            "endpoint": "functions",
-            "name_path": ['name', 'localized', 'en_US'],
-            "locale": "en_US"
-        },
-        "ad_analytics_by_member_job_title": {
-            "endpoint": "titles",
-            "name_path": ['name', 'localized', 'en_US'],
-            "locale": "en_US"
-        },
-        "ad_analytics_by_member_industry": {
-            "endpoint": "industries",
-            "name_path": ['name', 'localized', 'en_US'],
-            "locale": "(language:en,country:US)"
-        },
-        "ad_analytics_by_member_company": {
-            "endpoint": "organizations",
-            "name_path": ['name', 'localized', 'en_US']
-        },
-        "ad_analytics_by_member_seniority": {
-            "endpoint": "seniorities",
-            "name_path": ["name", "localized", "en_US"],
-            "locale": None
-        },
-    }
-    
+    needs_resolve = bool(client) and stream_name in RESOLUTION_CONFIGS
+    set_record = full_records.setdefault
+    add_urn = urns_to_resolve.add
+
     for page in data:
         # Loop through each record of the page
         for element in page:
@@ -219,30 +299,31 @@ def merge_responses(pivot, data, client=None, stream_name=None):
             element["pivot_value"] = temp_pivotValue
 
             # Collect URNs for resolution
-            if client and stream_name in resolution_configs:
-                urns_to_resolve.add(temp_pivotValue)
-
-            string_start = '{}-{}-{}'.format(temp_start['year'], temp_start['month'], temp_start['day'])
-            primary_key = (temp_pivotValue, string_start)
-            if primary_key in full_records:
-                # Update existing record with same primary key
-                full_records[primary_key].update(element)
-            else:
-                full_records[primary_key] = element
+            if needs_resolve:
+                add_urn(temp_pivotValue)
+
+            primary_key = (temp_pivotValue, f"{temp_start['year']}-{temp_start['month']}-{temp_start['day']}")
+            # The first element of a primary key is kept as its record, the elements of the
+            # other chunks are merged into it in place
+            record = set_record(primary_key, element)
+            if record is not element:
+                record.update(element)
 
     # Resolve names if needed
-    if client and stream_name in resolution_configs:
-        config = resolution_configs[stream_name]
+    if needs_resolve:
+        config = RESOLUTION_CONFIGS[stream_name]
+        # The resolver caches the names across campaigns and windows, it only requests the URNs
+        # which were not resolved before
         resolved_names = batch_resolve_urns(
-            client, 
-            urns_to_resolve, 
+            client,
+            urns_to_resolve,
             config["endpoint"],
             config.get("name_path"),
             config.get("locale")
         )
         # Update records with resolved names
         for record in full_records.values():
-            code = record["pivot_value"].split(':')[-1]
+            code = record["pivot_value"].rpartition(':')[2]
             record["pivot_value_name"] = resolved_names.get(code, code)
 
     return full_records
@@ -267,11 +348,14 @@ class LinkedInAds:
         foreign_key          : Primary key of the Parent stream.
         children             : A collection of child endpoints (where the endpoint path includes the parent id)
         parent               : On each of the children, name of the parent stream
+        parent_batch_size    : On each of the children, max number of parent ids requested together in one sync
 
     """
     tap_stream_id = None
     replicaiton_method = None
     replication_keys = None
+    bookmark_field = None
+    url_template = None
     key_properties = []
     foreign_key = None
     account_filter = None
@@ -279,15 +363,65 @@ class LinkedInAds:
     parent = None
     data_key = None
     children = []
+    parent_batch_size = 1
     count = None
     params = {}
     headers = {}
+    # Schema and metadata map of the stream, set once from the catalog
+    schema = None
+    stream_metadata = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the replication key used for bookmarks once for each stream class
+        cls.bookmark_field = cls.replication_keys[0] if cls.replication_keys else None
+        cls.url_template = cls.build_url_template()
+
+    @classmethod
+    def build_url_template(cls):
+        """
+        Return the format string of the first page URL of the stream, with the base URL and path
+        filled in. Only the query string, and the account or parent ID, are filled in per sync.
+        """
+        if cls.tap_stream_id in NEW_PATH_STREAMS:
+            # As per the latest linkedin version, few url formats are modified, it expects advertiser
+            # account_id in each url path
+            return '{}/adAccounts/{{account}}/{}?{{querystring}}'.format(BASE_URL, cls.path)
+        if cls.path == 'posts':
+            return '{}/{}?{{querystring}}&dscAdAccount=urn%3Ali%3AsponsoredAccount%3A{{parent_id}}'.format(
+                BASE_URL, cls.path)
+        return '{}/{}?{{querystring}}'.format(BASE_URL, cls.path)
+
+    def __init__(self):
+        # Copy the class level params and headers so each object updates its own dicts
+        self.params = dict(type(self).params)
+        self.headers = dict(type(self).headers)
+
+    def get_child_objs(self, selected_streams):
+        """
+        Return a new object of each selected child stream, by stream name.
+        """
+        return {child_stream_name: STREAMS[child_stream_name]()
+                for child_stream_name in self.children
+                if child_stream_name in selected_streams}
+
+    def load_schema(self, catalog):
+        """
+        Read the schema and metadata map of the stream from the catalog.
+        The catalog does not change during a sync, so it is only read once per stream object.
+        """
+        if self.schema is None:
+            stream = catalog.get_stream(self.tap_stream_id)
+            self.schema = stream.schema.to_dict()
+            self.stream_metadata = metadata.to_map(stream.metadata)
+        return self.schema, self.stream_metadata
+
     def write_schema(self, catalog):
         """
         Write the schema for the selected stream.
         """
         stream = catalog.get_stream(self.tap_stream_id)
-        schema = stream.schema.to_dict()
+        schema, _ = self.load_schema(catalog)
         try:
             singer.write_schema(self.tap_stream_id, schema, stream.key_properties)
         except OSError as err:
@@ -299,7 +433,8 @@ class LinkedInAds:
         Write the record for the selected stream.
         """
         try:
-            singer.write_record(self.tap_stream_id, record, time_extracted=time_extracted)
+            with WRITE_LOCK:
+                singer.write_record(self.tap_stream_id, record, time_extracted=time_extracted)
         except OSError as err:
             LOGGER.info('OS Error writing record for: %s', self.tap_stream_id)
             LOGGER.info('record: %s', record)
@@ -330,48 +465,53 @@ class LinkedInAds:
         Transform and write a record if the replication key value is greater than the last bookmark.
         Update maximum bookmark value to write in the state.
         """
-        stream = catalog.get_stream(self.tap_stream_id)
-        schema = stream.schema.to_dict()
-        stream_metadata = metadata.to_map(stream.metadata)
-        with metrics.record_counter(self.tap_stream_id) as counter:
+        schema, stream_metadata = self.load_schema(catalog)
+
+        # Parse the bookmark boundaries once, instead of once per record
+        last_dttm = strptime_to_utc(last_datetime) if last_datetime else None
+        max_bookmark_dttm = strptime_to_utc(max_bookmark_value) if max_bookmark_value else None
+        # Resolve the per-stream attributes once, instead of once per record
+        parent_id_field = self.parent + '_id' if parent_id and self.parent else None
+        full_table = self.replication_method == "FULL_TABLE"
+        write_record = self.write_record
+
+        # A single transformer is reused for all the records of the batch
+        with metrics.record_counter(self.tap_stream_id) as counter, \
+            Transformer(integer_datetime_fmt=UNIX_MILLISECONDS_INTEGER_DATETIME_PARSING) as transformer:
             for record in records:
                 # If child object, add parent_id to record
-                if parent_id and self.parent:
-                    record[self.parent + '_id'] = parent_id
+                if parent_id_field:
+                    record[parent_id_field] = parent_id
 
                 # Transform record for Singer.io
-                with Transformer(integer_datetime_fmt=UNIX_MILLISECONDS_INTEGER_DATETIME_PARSING) \
-                    as transformer:
-                    transformed_record = transformer.transform(
-                        record,
-                        schema,
-                        stream_metadata)
-                    
-                    # For FULL_TABLE replication, always write the record
-                    if self.replication_method == "FULL_TABLE":
-                        self.write_record(transformed_record, time_extracted=time_extracted)
-                        counter.increment()
-                        # Still track max bookmark for state
-                        if bookmark_field and (bookmark_field in transformed_record):
-                            if max_bookmark_value is None or strptime_to_utc(transformed_record[bookmark_field]) > strptime_to_utc(max_bookmark_value):
-                                max_bookmark_value = transformed_record[bookmark_field]
-                    else:
-                        # For INCREMENTAL replication, check bookmark values
-                        if bookmark_field and (bookmark_field in transformed_record):
-                            # Reset max_bookmark_value to new value if higher
-                            if max_bookmark_value is None or strptime_to_utc(transformed_record[bookmark_field]) > strptime_to_utc(max_bookmark_value):
-                                max_bookmark_value = transformed_record[bookmark_field]
-
-                            last_dttm = strptime_to_utc(last_datetime)
-                            bookmark_dttm = strptime_to_utc(transformed_record[bookmark_field])
-                            # Keep only records whose bookmark is after the last_datetime
-                            if bookmark_dttm >= last_dttm:
-                                self.write_record(transformed_record, time_extracted=time_extracted)
-                                counter.increment()
-                        else:
-                            # Write record if replication key is not available in the record
-                            self.write_record(transformed_record, time_extracted=time_extracted)
+                transformed_record = transformer.transform(
+                    record,
+                    schema,
+                    stream_metadata)
+
+                bookmark_dttm = None
+                if bookmark_field and (bookmark_field in transformed_record):
+                    bookmark_dttm = strptime_to_utc(transformed_record[bookmark_field])
+                    # Reset max_bookmark_value to new value if higher
+                    if max_bookmark_dttm is None or bookmark_dttm > max_bookmark_dttm:
+                        max_bookmark_dttm = bookmark_dttm
+                        max_bookmark_value = transformed_record[bookmark_field]
+
+                # For FULL_TABLE replication, always write the record
+                if full_table:
+                    write_record(transformed_record, time_extracted=time_extracted)
+                    counter.increment()
+                else:
+                    # For INCREMENTAL replication, check bookmark values
+                    if bookmark_dttm is not None:
+                        # Keep only records whose bookmark is after the last_datetime
+                        if bookmark_dttm >= last_dttm:
+                            write_record(transformed_record, time_extracted=time_extracted)
                             counter.increment()
+                    else:
+                        # Write record if replication key is not available in the record
+                        write_record(transformed_record, time_extracted=time_extracted)
+                        counter.increment()
 
             return max_bookmark_value, counter.value
 
@@ -388,28 +528,25 @@ class LinkedInAds:
                       account_list=None):
         """
         Sync a specific parent or child endpoint.
+        The pages of every account are requested through the same client, which is expected to
+        keep its connections alive (LinkedinClient uses a pooled requests.Session).
         """
         # Get the latest bookmark for the stream and set the last_datetime
         last_datetime = self.get_bookmark(state, start_date)
-        max_bookmark_value = last_datetime
-        LOGGER.info('%s: bookmark last_datetime = %s', self.tap_stream_id, max_bookmark_value)
+        LOGGER.info('%s: bookmark last_datetime = %s', self.tap_stream_id, last_datetime)
 
-        bookmark_field = next(iter(self.replication_keys))
-        # Initialize child_max_bookmarks
+        # Initialize child_max_bookmarks, shared by all the accounts
         child_max_bookmarks = {}
-        children = self.children
+        child_objs = self.get_child_objs(selected_streams)
         # Loop through all children
-        for child_stream_name in children:
-
-            if child_stream_name in selected_streams:
-                child_obj = STREAMS[child_stream_name]()
-                # Write schema for each child stream
-                child_obj.write_schema(catalog)
-                child_bookmark_field = child_obj.replication_keys
-                if child_bookmark_field:
-                    child_last_datetime = child_obj.get_bookmark(state, start_date)
-                    # Add the last bookmark of child stream in the `child_max_bookmarks` map
-                    child_max_bookmarks[child_stream_name] = child_last_datetime
+        for child_stream_name, child_obj in child_objs.items():
+            # Write schema for each child stream
+            child_obj.write_schema(catalog)
+            child_bookmark_field = child_obj.replication_keys
+            if child_bookmark_field:
+                child_last_datetime = child_obj.get_bookmark(state, start_date)
+                # Add the last bookmark of child stream in the `child_max_bookmarks` map
+                child_max_bookmarks[child_stream_name] = child_last_datetime
 
         # Pagination reference:
         # https://docs.microsoft.com/en-us/linkedin/shared/api-guide/concepts/pagination?context=linkedin/marketing/context
@@ -417,8 +554,6 @@ class LinkedInAds:
         # Increase the "start" by the "count" for each batch.
         # Continue until the "start" exceeds the total_records.
         start = 0 # Starting offset value for each batch API call
-        total_records = 0
-        page = 1
 
         if self.tap_stream_id in CURSOR_BASED_PAGINATION_STREAMS:
             # hardcoding the pagesize to 1000 for stream - accounts, as search and pageToken param can't be present at the same time.
@@ -435,141 +570,209 @@ class LinkedInAds:
                 **self.params # adds in endpoint specific, sort, filter params
             }
 
-        querystring = '&'.join(['%s=%s' % (key, value) for (key, value) in endpoint_params.items()])
+        # Param values such as the account search and creatives campaigns are already encoded in the
+        # format LinkedIn expects, so keep the Rest.li syntax characters and `%` as they are.
+        querystring = urllib.parse.urlencode(endpoint_params, safe=URL_SAFE_CHARS)
 
-        urllist = []
         if self.tap_stream_id in NEW_PATH_STREAMS:
-            # As per the latest linkedin version, few url formats are modified, it expects advertiser
-            # account_id in each url path
-            for account in account_list:
-                url = "{}/adAccounts/{}/{}?{}".format(BASE_URL, account, self.path, querystring)
-                urllist.append((account, url))
+            urllist = [(account, self.url_template.format(account=account, querystring=querystring))
+                       for account in account_list]
         else:
-            if self.path == 'posts':
-                url = '{}/{}?{}&dscAdAccount=urn%3Ali%3AsponsoredAccount%3A{}'.format(BASE_URL, self.path, querystring, parent_id)
-            else:
-                url = '{}/{}?{}'.format(BASE_URL, self.path, querystring)
-            urllist.append((None, url))
-
-        for acct_id, next_url in urllist:
-            while next_url: #pylint: disable=too-many-nested-blocks
-                LOGGER.info('URL for %s: %s', self.tap_stream_id, next_url)
-
-                # Get data, API request
-                data = client.get(
-                    url=next_url,
-                    endpoint=self.tap_stream_id,
-                    headers=self.headers)
-                # time_extracted: datetime when the data was extracted from the API
-                time_extracted = utils.now()
-
-                # Transform data with transform_json from transform.py
-                #  This function converts unix datetimes, de-nests audit fields,
-                #  tranforms URNs to IDs, tranforms/abstracts variably named fields,
-                #  converts camelCase to snake_case for fieldname keys.
-                # For the Linkedin Ads API, 'elements' is always the root data_key for records.
-                # The data_key identifies the collection of records below the <root> element
-                transformed_data = [] # initialize the record list
-                if self.data_key in data:
-                    transformed_data = transform_json(data, self.tap_stream_id)[self.data_key]
-                if not transformed_data or transformed_data is None:
-                    LOGGER.info('No transformed_data')
-                    break # No data results
+            urllist = [(None, self.url_template.format(parent_id=parent_id, querystring=querystring))]
 
-                pre_singer_transformed_data = copy.deepcopy(transformed_data)
-                if self.tap_stream_id in selected_streams:
-                    # Process records and gets the max_bookmark_value and record_count for the set of records
-                    max_bookmark_value, record_count = self.process_records(
-                        catalog=catalog,
-                        records=transformed_data,
-                        time_extracted=time_extracted,
-                        bookmark_field=bookmark_field,
-                        max_bookmark_value=max_bookmark_value,
-                        last_datetime=last_datetime,
-                        parent_id=parent_id)
-                    LOGGER.info('%s, records processed: %s', self.tap_stream_id, record_count)
-                    total_records = total_records + record_count
-
-                # Loop thru parent batch records for each children objects
-                for child_stream_name in children:
-                    if child_stream_name in selected_streams:
-                        # For each parent record
-                        child_obj = STREAMS[child_stream_name]()
-
-                        for record in pre_singer_transformed_data:
-
-                            parent_id = record.get(child_obj.foreign_key)
-
-                            child_stream_params = child_obj.params
-                            # Add children filter params based on parent IDs
-                            if self.tap_stream_id == 'accounts':
-                                account = 'urn:li:sponsoredAccount:{}'.format(parent_id)
-                            elif self.tap_stream_id == 'campaigns':
-                                campaign = 'urn:li:sponsoredCampaign:{}'.format(parent_id)
-                                if child_stream_name == 'creatives':
-                                    # The value of the campaigns in the query params should be passed in the encoded format.
-                                    # Ref - https://learn.microsoft.com/en-us/linkedin/marketing/integrations/ads/account-structure/create-and-manage-creatives?view=li-lms-2023-01&tabs=http#sample-request-3
-                                    child_stream_params['campaigns'] = 'List(urn%3Ali%3AsponsoredCampaign%3A{})'.format(parent_id)
-                                elif child_stream_name in (ANALYTICS_STREAMS):
-                                    child_stream_params['campaigns[0]'] = campaign
-
-                            # Update params for the child stream
-                            child_obj.params = child_stream_params
-                            LOGGER.info('Syncing: %s, parent_stream: %s, parent_id: %s',
-                                        child_stream_name,
-                                        self.tap_stream_id,
-                                        parent_id)
-
-                            # Call sync method for the child stream
-                            if child_stream_name in ANALYTICS_STREAMS:
-                                child_total_records, child_batch_bookmark_value = child_obj.sync_ad_analytics(
-                                    client=client,
-                                    catalog=catalog,
-                                    last_datetime=child_obj.get_bookmark(state, start_date),
-                                    date_window_size=date_window_size,
-                                    parent_id=parent_id)
-                            else:
-                                child_total_records, child_batch_bookmark_value = child_obj.sync_endpoint(
-                                    client=client,
-                                    catalog=catalog,
-                                    state=state,
-                                    page_size=page_size,
-                                    start_date=start_date,
-                                    selected_streams=selected_streams,
-                                    date_window_size=date_window_size,
-                                    parent_id=parent_id,
-                                    account_list=[acct_id])
-
-                            child_batch_bookmark_dttm = strptime_to_utc(child_batch_bookmark_value)
-                            child_max_bookmark = child_max_bookmarks.get(child_stream_name)
-                            child_max_bookmark_dttm = strptime_to_utc(child_max_bookmark)
-                            if child_batch_bookmark_dttm > child_max_bookmark_dttm:
-                                # Update bookmark for child stream.
-                                child_max_bookmarks[child_stream_name] = strftime(child_batch_bookmark_dttm)
-
-                            LOGGER.info('Synced: %s, parent_id: %s, total_records: %s',
-                                        child_stream_name,
-                                        parent_id,
-                                        child_total_records)
-                            LOGGER.info('FINISHED Syncing: %s', child_stream_name)
-
-                # Pagination: Get next_url
-                next_url = get_next_url(self.tap_stream_id, next_url, data)
-
-                if self.tap_stream_id in selected_streams:
-                    LOGGER.info('%s: Synced page %s, this page: %s. Total records processed: %s',
-                                self.tap_stream_id,
-                                page,
-                                record_count,
-                                total_records)
-                page = page + 1
+        sync_args = (client, catalog, state, page_size, start_date, selected_streams,
+                     date_window_size, parent_id, last_datetime, child_max_bookmarks)
+        if len(urllist) == 1:
+            results = [self._sync_one_account(*sync_args, child_objs, *urllist[0])]
+        else:
+            # Accounts are independent and the sync of each one mostly waits on the API,
+            # so they are synced concurrently. The params of the child objects are set for
+            # each batch of parent IDs, so every account syncs its children with its own objects.
+            with ThreadPoolExecutor(max_workers=min(MAX_ACCOUNT_WORKERS, len(urllist))) as executor:
+                futures = [executor.submit(self._sync_one_account, *sync_args,
+                                           self.get_child_objs(selected_streams), acct_id, next_url)
+                           for acct_id, next_url in urllist]
+                results = [future.result() for future in futures]
+
+        total_records = sum(account_total_records for account_total_records, _ in results)
+        max_bookmark_value = max((account_max_bookmark for _, account_max_bookmark in results),
+                                 key=strptime_to_utc, default=last_datetime)
 
         # Write child stream's bookmarks
-        for key, val in list(child_max_bookmarks.items()):
+        for key, val in child_max_bookmarks.items():
             write_bookmark(state, val, key)
+        if child_max_bookmarks:
+            flush_state(state)
+
+        return total_records, max_bookmark_value
+
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    def _sync_one_account(self,
+                          client,
+                          catalog,
+                          state,
+                          page_size,
+                          start_date,
+                          selected_streams,
+                          date_window_size,
+                          parent_id,
+                          last_datetime,
+                          child_max_bookmarks,
+                          child_objs,
+                          acct_id,
+                          next_url):
+        """
+        Sync all the pages of the stream, and its children with child_objs, starting at next_url for one account.
+        Update the max bookmark of each child stream in child_max_bookmarks.
+        Return the record count and the max bookmark.
+        """
+        max_bookmark_value = last_datetime
+        total_records = 0
+        page = 1
+
+        while next_url: #pylint: disable=too-many-nested-blocks
+            LOGGER.info('URL for %s: %s', self.tap_stream_id, next_url)
+
+            # Get data, API request. The client adds its own headers to the dict it is given,
+            # so each request gets a copy of the stream headers shared by the accounts.
+            data = client.get(
+                url=next_url,
+                endpoint=self.tap_stream_id,
+                headers=dict(self.headers))
+            # time_extracted: datetime when the data was extracted from the API
+            time_extracted = utils.now()
+
+            # Transform data with transform_records from transform.py
+            #  This function converts unix datetimes, de-nests audit fields,
+            #  tranforms URNs to IDs, tranforms/abstracts variably named fields,
+            #  converts camelCase to snake_case for fieldname keys.
+            # For the Linkedin Ads API, 'elements' is always the root data_key for records.
+            # The data_key identifies the collection of records below the <root> element
+            if not data.get(self.data_key):
+                LOGGER.info('No transformed_data')
+                break # No data results
+
+            # Records are transformed lazily while they are processed. Children only need the
+            # parent's foreign key, so those values are collected in the same pass.
+            parent_ids_by_key = {child_obj.foreign_key: [] for child_obj in child_objs.values()}
+            transformed_data = collect_parent_ids(
+                transform_records(data[self.data_key], self.tap_stream_id),
+                parent_ids_by_key)
+            if self.tap_stream_id in selected_streams:
+                # Process records and gets the max_bookmark_value and record_count for the set of records
+                max_bookmark_value, record_count = self.process_records(
+                    catalog=catalog,
+                    records=transformed_data,
+                    time_extracted=time_extracted,
+                    bookmark_field=self.bookmark_field,
+                    max_bookmark_value=max_bookmark_value,
+                    last_datetime=last_datetime,
+                    parent_id=parent_id)
+                LOGGER.info('%s, records processed: %s', self.tap_stream_id, record_count)
+                total_records = total_records + record_count
+
+            # Make sure all the parent IDs are collected even if the records are not written
+            for _ in transformed_data:
+                pass
+
+            # Loop thru parent batch records for each children objects
+            for child_stream_name, child_obj in child_objs.items():
+                # Children which accept multiple parents in a single request are synced for
+                # a batch of parent IDs at a time, others are synced for each parent ID
+                for parent_id_batch in split_into_chunks(parent_ids_by_key[child_obj.foreign_key],
+                                                         child_obj.parent_batch_size):
+                    # A child synced for multiple parents is not tied to a single parent record
+                    parent_id = parent_id_batch[0] if len(parent_id_batch) == 1 else None
+
+                    child_stream_params = child_obj.params
+                    # Add children filter params based on parent IDs
+                    if self.tap_stream_id == 'accounts':
+                        account = 'urn:li:sponsoredAccount:{}'.format(parent_id)
+                    elif self.tap_stream_id == 'campaigns':
+                        if child_stream_name == 'creatives':
+                            # The value of the campaigns in the query params should be passed in the encoded format.
+                            # Ref - https://learn.microsoft.com/en-us/linkedin/marketing/integrations/ads/account-structure/create-and-manage-creatives?view=li-lms-2023-01&tabs=http#sample-request-3
+                            child_stream_params['campaigns'] = 'List({})'.format(','.join(
+                                'urn%3Ali%3AsponsoredCampaign%3A{}'.format(campaign_id)
+                                for campaign_id in parent_id_batch))
+                        elif child_stream_name in ANALYTICS_STREAMS:
+                            # Drop the campaigns of the previous batch, which may have been larger
+                            for key in [key for key in child_stream_params if key.startswith('campaigns[')]:
+                                del child_stream_params[key]
+                            for idx, campaign_id in enumerate(parent_id_batch):
+                                child_stream_params['campaigns[{}]'.format(idx)] = \
+                                    'urn:li:sponsoredCampaign:{}'.format(campaign_id)
+
+                    LOGGER.info('Syncing: %s, parent_stream: %s, parent_ids: %s',
+                                child_stream_name,
+                                self.tap_stream_id,
+                                parent_id_batch)
+
+                    # Call sync method for the child stream
+                    if child_stream_name in ANALYTICS_STREAMS:
+                        child_total_records, child_batch_bookmark_value = child_obj.sync_ad_analytics(
+                            client=client,
+                            catalog=catalog,
+                            last_datetime=child_obj.get_bookmark(state, start_date),
+                            date_window_size=date_window_size,
+                            parent_id=parent_id)
+                    else:
+                        child_total_records, child_batch_bookmark_value = child_obj.sync_endpoint(
+                            client=client,
+                            catalog=catalog,
+                            state=state,
+                            page_size=page_size,
+                            start_date=start_date,
+                            selected_streams=selected_streams,
+                            date_window_size=date_window_size,
+                            parent_id=parent_id,
+                            account_list=[acct_id])
+
+                    # Update bookmark for child stream.
+                    update_child_bookmark(child_max_bookmarks, child_stream_name, child_batch_bookmark_value)
+
+                    LOGGER.info('Synced: %s, parent_ids: %s, total_records: %s',
+                                child_stream_name,
+                                parent_id_batch,
+                                child_total_records)
+                    LOGGER.info('FINISHED Syncing: %s', child_stream_name)
+
+            # Pagination: Get next_url
+            next_url = get_next_url(self.tap_stream_id, next_url, data)
+
+            if self.tap_stream_id in selected_streams:
+                LOGGER.info('%s: Synced page %s, this page: %s. Total records processed: %s',
+                            self.tap_stream_id,
+                            page,
+                            record_count,
+                            total_records)
+            page = page + 1
 
         return total_records, max_bookmark_value
 
+    def fetch_analytics_window(self, client, chunk_executor, chunk_fields, window_params):
+        """
+        Fetch the pages of every field chunk, given as the comma separated `fields` param values, for
+        the date window of window_params using chunk_executor, and merge them into the records of the window.
+        """
+        chunk_params = [{"start": 0,
+                         **window_params,
+                         'fields': fields}
+                        for fields in chunk_fields]
+        stream_name = self.tap_stream_id
+        path = self.path
+        data_key = self.data_key
+        chunk_pages = chunk_executor.map(
+            lambda params: list(sync_analytics_endpoint(client, stream_name, path, params)),
+            chunk_params)
+        # The pages are merged in the order of the chunks, the same as when fetched one after another
+        responses = [page[data_key]
+                     for pages in chunk_pages
+                     for page in pages
+                     if page.get(data_key)]
+        pivot = window_params.get("pivot")
+        return merge_responses(pivot, responses, client, stream_name)
+
     # pylint: disable=too-many-branches,too-many-statements,unused-argument
     def sync_ad_analytics(self, client, catalog, last_datetime, date_window_size, parent_id=None):
         """
@@ -579,8 +782,6 @@ class LinkedInAds:
         # to make sure there's always room for us to append `dateRange`, and `pivotValues`
         MAX_CHUNK_LENGTH = 18
 
-        bookmark_field = next(iter(self.replication_keys))
-
         max_bookmark_value = last_datetime
         last_datetime_dt = strptime_to_utc(last_datetime) - timedelta(days=7)
 
@@ -610,9 +811,10 @@ class LinkedInAds:
 
         # Here, valid_selected_fields is a list of fields that the user has selected.
         # API accepts these fields in the parameter and returns its value in the response.
-        valid_selected_fields = [snake_case_to_camel_case(field)
+        valid_selected_fields = [camel_case_field
                                  for field in selected_fields(catalog.get_stream(self.tap_stream_id))
-                                 if snake_case_to_camel_case(field) not in FIELDS_UNAVAILABLE_FOR_AD_ANALYTICS]
+                                 if (camel_case_field := snake_case_to_camel_case(field))
+                                 not in FIELDS_UNAVAILABLE_FOR_AD_ANALYTICS]
 
         # When testing the API, if the fields in `field` all return `0` then
         # the API returns its empty response.
@@ -621,17 +823,17 @@ class LinkedInAds:
         # (even if this means the values are all `0`) and a day with null
         # values. We found that requesting these fields gives you the days with
         # non-null values
-        first_chunk = [['dateRange', 'pivotValues']]
-
-        chunks = first_chunk + list(split_into_chunks(valid_selected_fields, MAX_CHUNK_LENGTH))
+        first_chunk = [list(ANALYTICS_KEY_FIELDS)]
 
-        # We have to append these fields in order to ensure we get them back
+        # We have to add these fields to every chunk in order to ensure we get them back
         # so that we can create the composite primary key for the record and
         # to merge the multiple responses based on this primary key
-        for chunk in chunks:
-            for field in ['dateRange', 'pivotValues']:
-                if field not in chunk:
-                    chunk.append(field)
+        chunks = first_chunk + [ANALYTICS_KEY_FIELDS + chunk
+                                for chunk in split_into_chunks(
+                                    [field for field in valid_selected_fields if field not in ANALYTICS_KEY_FIELDS],
+                                    MAX_CHUNK_LENGTH)]
+        # The chunks are the same for every window, so their `fields` param values are joined once
+        chunk_fields = [','.join(chunk) for chunk in chunks]
 
         ############### PAGINATION (for these 2 streams) ###############
         # The Tap requests LinkedIn with one Campaign ID at one time.
@@ -642,51 +844,61 @@ class LinkedInAds:
         # If "count=100" and records=100 in the API are the same then the next URL will be returned and if we hit that URL, 400 error code will be returned.
         # This case is unreachable because here "count" is 10000 and at maximum, only 3000 records will be returned in an API response.
 
-        total_records = 0
-        while window_end_date <= today:
-            responses = []
-            for chunk in chunks:
-                static_params['fields'] = ','.join(chunk)
-                params = {"start": 0,
-                          **static_params}
-                query_string = '&'.join(['%s=%s' % (key, value) for (key, value) in params.items()])
-                LOGGER.info('Syncing %s from %s to %s', parent_id, window_start_date, window_end_date)
-                for page in sync_analytics_endpoint(client, self.tap_stream_id, self.path, query_string):
-                    if page.get(self.data_key):
-                        responses.append(page.get(self.data_key))
-            pivot = params["pivot"] if "pivot" in params.keys() else None
-            raw_records = merge_responses(pivot, responses, client, self.tap_stream_id)
-            time_extracted = utils.now()
+        # The records of DAILY analytics do not depend on the window they are requested with, so
+        # the window size adapts to the number of records. MONTHLY records are aggregated over
+        # the part of the month in the window, so their windows keep the configured size.
+        window_size = date_window_size
+        if self.params.get('timeGranularity') == 'DAILY':
+            max_window_size = max(date_window_size, MAX_DAILY_WINDOW_DAYS)
+        else:
+            max_window_size = date_window_size
 
-            # While we broke the ad_analytics streams out from
-            # `sync_endpoint()`, we want to process them the same. And
-            # transform_json() expects a dictionary with a key equal to
-            # `data_key` and its value is the response from the API
-
-            # Note that `transform_json()` returns the same structure we pass
-            # in. `sync_endpoint()` grabs `data_key` from the return value, so
-            # we mirror that here
-            transformed_data = transform_json({self.data_key: list(raw_records.values())},
-                                              self.tap_stream_id)[self.data_key]
-            if not transformed_data:
-                LOGGER.info('No transformed_data')
-            else:
-                max_bookmark_value, record_count = self.process_records(
-                    catalog=catalog,
-                    records=transformed_data,
-                    time_extracted=time_extracted,
-                    bookmark_field=bookmark_field,
-                    max_bookmark_value=last_datetime,
-                    last_datetime=strftime(last_datetime_dt),
-                    parent_id=parent_id)
-                LOGGER.info('%s, records processed: %s', self.tap_stream_id, record_count)
-                LOGGER.info('%s: max_bookmark: %s', self.tap_stream_id, max_bookmark_value)
-                total_records += record_count
+        # Records are filtered on the bookmark less the lookback, the same for every window
+        last_datetime_str = strftime(last_datetime_dt)
+        # A batch of campaigns has no single parent_id, so the windows are logged with the campaigns of the params
+        campaign_ids = [urn.rsplit(':', 1)[-1] for key, urn in self.params.items() if key.startswith('campaigns[')]
 
-            window_start_date, window_end_date, static_params = shift_sync_window(static_params, today, date_window_size)
+        total_records = 0
+        # The field chunks of a window are independent requests, so they are fetched concurrently.
+        # The next window is fetched in the background while the records of the current window
+        # are transformed and written.
+        with ThreadPoolExecutor(max_workers=min(MAX_CHUNK_WORKERS, len(chunks))) as chunk_executor, \
+                ThreadPoolExecutor(max_workers=1) as window_executor:
+            LOGGER.info('Syncing campaigns %s from %s to %s, field chunks: %s',
+                        campaign_ids, window_start_date, window_end_date, len(chunk_fields))
+            next_window = window_executor.submit(self.fetch_analytics_window,
+                                                 client, chunk_executor, chunk_fields, static_params)
+            while next_window:
+                raw_records = next_window.result()
+                time_extracted = utils.now()
 
-            if window_start_date == window_end_date:
-                break
+                window_size = next_window_size(window_size, len(raw_records), max_window_size)
+                window_start_date, window_end_date, static_params = shift_sync_window(static_params, today, window_size)
+                if window_start_date == window_end_date:
+                    next_window = None
+                else:
+                    LOGGER.info('Syncing campaigns %s from %s to %s, field chunks: %s',
+                                campaign_ids, window_start_date, window_end_date, len(chunk_fields))
+                    next_window = window_executor.submit(self.fetch_analytics_window,
+                                                         client, chunk_executor, chunk_fields, static_params)
+
+                if not raw_records:
+                    LOGGER.info('No transformed_data')
+                else:
+                    # While we broke the ad_analytics streams out from `sync_endpoint()`, we want
+                    # to process them the same, so the merged records are transformed lazily
+                    # with transform_records() while they are processed.
+                    max_bookmark_value, record_count = self.process_records(
+                        catalog=catalog,
+                        records=transform_records(raw_records.values(), self.tap_stream_id),
+                        time_extracted=time_extracted,
+                        bookmark_field=self.bookmark_field,
+                        max_bookmark_value=last_datetime,
+                        last_datetime=last_datetime_str,
+                        parent_id=parent_id)
+                    LOGGER.info('%s, records processed: %s', self.tap_stream_id, record_count)
+                    LOGGER.info('%s: max_bookmark: %s', self.tap_stream_id, max_bookmark_value)
+                    total_records += record_count
 
         return total_records, max_bookmark_value
 
@@ -778,7 +990,7 @@ class Campaigns(LinkedInAds):
     account_filter = "search_account_values_param"
     path = "adCampaigns"
     data_key = "elements"
-    children = ["creatives"] + ANALYTICS_STREAMS
+    children = ["creatives"] + sorted(ANALYTICS_STREAMS)
     params = {
         "q": "search",
         "search.status.values[0]": "ACTIVE",
@@ -803,6 +1015,8 @@ class Creatives(LinkedInAds):
     foreign_key = "id"
     data_key = "elements"
     parent = "campaigns"
+    # Creatives carry their own campaign, so multiple campaigns are requested together.
+    parent_batch_size = 20
     # The value of the campaigns in the query params should be passed in the encoded format.
     # Ref - https://learn.microsoft.com/en-us/linkedin/marketing/integrations/ads/account-structure/create-and-manage-creatives?view=li-lms-2023-01&tabs=http#sample-request-3
     params = {
@@ -815,201 +1029,65 @@ class Creatives(LinkedInAds):
     headers = {'X-Restli-Protocol-Version': "2.0.0",
                "X-RestLi-Method": "FINDER"}
 
-class AdAnalyticsByCampaign(LinkedInAds):
-    """
-    https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads-reporting/ads-reporting#analytics-finder
-    """
-    tap_stream_id = "ad_analytics_by_campaign"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "CAMPAIGN",
-        "timeGranularity": "DAILY",
-        "count": 10000
-    }
-
-class AdAnalyticsByCreative(LinkedInAds):
-    """
-    https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads-reporting/ads-reporting#analytics-finder
-    """
-    tap_stream_id = "ad_analytics_by_creative"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["creative_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "CREATIVE",
-        "timeGranularity": "DAILY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberCompanySize(LinkedInAds):
+def make_analytics_stream(class_name, tap_stream_id, pivot, time_granularity, key_properties, **attributes):
     """
+    Create the stream class of an ad analytics endpoint, which only differ by their pivot,
+    time granularity and primary keys. Additional class attributes can be given as keyword arguments.
     https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads-reporting/ads-reporting#analytics-finder
     """
-    tap_stream_id = "ad_analytics_by_member_company_size"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_COMPANY_SIZE",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberIndustry(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_industry"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_INDUSTRY",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberSeniority(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_seniority"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_SENIORITY",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberJobTitle(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_job_title"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_JOB_TITLE",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberJobFunction(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_job_function"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_JOB_FUNCTION",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberCountryV2(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_country_v2"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_COUNTRY_V2",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberRegionV2(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_region_v2"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_REGION_V2",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByMemberCompany(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_member_company"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "MEMBER_COMPANY",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
-
-class AdAnalyticsByPlacementName(LinkedInAds):
-    tap_stream_id = "ad_analytics_by_placement_name"
-    replication_method = "INCREMENTAL"
-    replication_keys = ["end_at"]
-    key_properties = ["campaign_id", "start_at"]
-    account_filter = "accounts_param"
-    path = "adAnalytics"
-    foreign_key = "id"
-    data_key = "elements"
-    parent = "campaigns"
-    params = {
-        "q": "analytics",
-        "pivot": "PLACEMENT_NAME",
-        "timeGranularity": "MONTHLY",
-        "count": 10000
-    }
+    return type(class_name, (LinkedInAds,), {
+        'tap_stream_id': tap_stream_id,
+        'replication_method': "INCREMENTAL",
+        'replication_keys': ["end_at"],
+        'key_properties': key_properties,
+        'account_filter': "accounts_param",
+        'path': "adAnalytics",
+        'foreign_key': "id",
+        'data_key': "elements",
+        'parent': "campaigns",
+        'params': {
+            "q": "analytics",
+            "pivot": pivot,
+            "timeGranularity": time_granularity,
+            "count": 10000
+        },
+        **attributes
+    })
+
+# Records are pivoted by campaign, so multiple campaigns are requested together.
+# Other pivots would aggregate the metrics of all the requested campaigns.
+AdAnalyticsByCampaign = make_analytics_stream(
+    'AdAnalyticsByCampaign', "ad_analytics_by_campaign", "CAMPAIGN", "DAILY", ["campaign_id", "start_at"],
+    parent_batch_size=20)
+AdAnalyticsByCreative = make_analytics_stream(
+    'AdAnalyticsByCreative', "ad_analytics_by_creative", "CREATIVE", "DAILY", ["creative_id", "start_at"])
+AdAnalyticsByMemberCompanySize = make_analytics_stream(
+    'AdAnalyticsByMemberCompanySize', "ad_analytics_by_member_company_size", "MEMBER_COMPANY_SIZE", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberIndustry = make_analytics_stream(
+    'AdAnalyticsByMemberIndustry', "ad_analytics_by_member_industry", "MEMBER_INDUSTRY", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberSeniority = make_analytics_stream(
+    'AdAnalyticsByMemberSeniority', "ad_analytics_by_member_seniority", "MEMBER_SENIORITY", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberJobTitle = make_analytics_stream(
+    'AdAnalyticsByMemberJobTitle', "ad_analytics_by_member_job_title", "MEMBER_JOB_TITLE", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberJobFunction = make_analytics_stream(
+    'AdAnalyticsByMemberJobFunction', "ad_analytics_by_member_job_function", "MEMBER_JOB_FUNCTION", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberCountryV2 = make_analytics_stream(
+    'AdAnalyticsByMemberCountryV2', "ad_analytics_by_member_country_v2", "MEMBER_COUNTRY_V2", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberRegionV2 = make_analytics_stream(
+    'AdAnalyticsByMemberRegionV2', "ad_analytics_by_member_region_v2", "MEMBER_REGION_V2", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByMemberCompany = make_analytics_stream(
+    'AdAnalyticsByMemberCompany', "ad_analytics_by_member_company", "MEMBER_COMPANY", "MONTHLY",
+    ["campaign_id", "start_at"])
+AdAnalyticsByPlacementName = make_analytics_stream(
+    'AdAnalyticsByPlacementName', "ad_analytics_by_placement_name", "PLACEMENT_NAME", "MONTHLY",
+    ["campaign_id", "start_at"])
 
 # Dictionary of the stream classes
 STREAMS = {
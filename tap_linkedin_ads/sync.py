@@ -140,6 +140,7 @@ def sync(client, config, catalog, state):
         if stream_obj.replication_keys and stream_name in selected_streams:
             write_bookmark(state, max_bookmark_value, stream_name)
 
+        # Clearing currently_syncing also emits the bookmarks written above
         update_currently_syncing(state, None)
         LOGGER.info('Synced: %s, total_records: %s', stream_name, total_records)
         LOGGER.info('FINISHED Syncing: %s', stream_name)
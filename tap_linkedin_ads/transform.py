@@ -1,6 +1,7 @@
 import re
 from re import sub
 from decimal import Decimal
+from functools import lru_cache
 
 from datetime import datetime, timedelta
 import singer
@@ -9,10 +10,14 @@ LOGGER = singer.get_logger()
 
 
 # Convert camelCase to snake_case
+# Records of a stream share the same keys, so the conversions are cached
+@lru_cache(maxsize=4096)
 def convert(name):
     regsub = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', regsub).lower()
 
+# Field names come from a fixed catalog, so the conversions are cached
+@lru_cache(maxsize=1024)
 def snake_case_to_camel_case(text):
     if not text:
         return text
@@ -318,25 +323,29 @@ def transform_video_ads(data_dict):
         data_dict['created_time'] = data_dict["created_at"]
     return data_dict
 
+# Apply the stream specific transformations to a record with snake_case keys
+def transform_record(record, stream_name):
+    this_dict = record
+    if stream_name.startswith('ad_analytics_by_'):
+        this_dict = transform_analytics(this_dict)
+    elif stream_name == 'accounts':
+        this_dict = transform_accounts(this_dict)
+    elif stream_name == 'campaigns':
+        this_dict = transform_campaigns(this_dict)
+    elif stream_name == 'creatives':
+        this_dict = transform_creatives(this_dict)
+    elif stream_name == 'video_ads':
+        this_dict = transform_video_ads(this_dict)
+    this_dict = transform_urn(this_dict)
+    this_dict = transform_audit_fields(this_dict)
+    return this_dict
+
+
 def transform_data(data_dict, stream_name):
     new_dict = data_dict
     i = 0
     for record in data_dict['elements']:
-        this_dict = record
-        if stream_name.startswith('ad_analytics_by_'):
-            this_dict = transform_analytics(this_dict)
-        elif stream_name == 'accounts':
-            this_dict = transform_accounts(this_dict)
-        elif stream_name == 'campaigns':
-            this_dict = transform_campaigns(this_dict)
-        elif stream_name == 'creatives':
-            this_dict = transform_creatives(this_dict)
-        elif stream_name == 'video_ads':
-            this_dict = transform_video_ads(this_dict)
-        this_dict = transform_urn(this_dict)
-        this_dict = transform_audit_fields(this_dict)
-
-        new_dict['elements'][i] = this_dict
+        new_dict['elements'][i] = transform_record(record, stream_name)
         i = i + 1
     return new_dict
 
@@ -346,3 +355,10 @@ def transform_json(this_json, stream_name):
     converted_json = convert_json(this_json)
     transformed_json = transform_data(converted_json, stream_name)
     return transformed_json
+
+
+# Yield the transformed records one at a time instead of converting the whole response up-front
+def transform_records(records, stream_name):
+    LOGGER.info('Transforming stream: %s', stream_name)
+    for record in records:
+        yield transform_record(convert_json(record), stream_name)
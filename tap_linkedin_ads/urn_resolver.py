@@ -1,25 +1,156 @@
 import logging
-from abc import ABC, abstractmethod
-from typing import Dict, Set, Optional, Any
+import threading
+from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Set, Optional, Any, Tuple, Type
+
+from tap_linkedin_ads.client import Server429Error
 
 LOGGER = logging.getLogger(__name__)
 
+# Max number of names kept for an endpoint and locale
+MAX_CACHED_NAMES = 50000
+
+class LRUCache(OrderedDict):
+    """Dict which drops its least recently used items once it holds more than maxsize of them."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        # The accounts are synced concurrently, reads reorder the items too
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+# Names resolved by any resolver, keyed by (endpoint, locale) and then by code.
+# A resolver is created for every resolve_urns call, the names are kept for the whole sync.
+URN_CACHE: Dict[Tuple[str, Optional[str]], LRUCache] = {}
+
+def name_cache(endpoint: str, locale: Optional[str]) -> LRUCache:
+    """Get the cache of the names of the endpoint and locale, it is created on first use."""
+    cache = URN_CACHE.get((endpoint, locale))
+    if cache is None:
+        cache = URN_CACHE.setdefault((endpoint, locale), LRUCache(MAX_CACHED_NAMES))
+    return cache
+
+# Codes being requested, keyed by (endpoint, locale, code). The accounts are synced concurrently,
+# a resolver waits for the pending request of a code instead of requesting it again.
+_INFLIGHT: Dict[Tuple[str, Optional[str], str], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# LinkedIn's batch limit
+CHUNK_SIZE = 150
+# Max number of chunks of a resolver requested at the same time
+MAX_CHUNK_WORKERS = 4
+# The client adds the authorization and method headers to the dict it is given, so it is copied for each request
+HEADERS = MappingProxyType({'X-Restli-Protocol-Version': '2.0.0'})
+
+def build_name_getter(name_paths: Tuple[Tuple[str, ...], ...]) -> Callable[[Any], Optional[str]]:
+    """
+    Build the function returning the first name found at the paths of a result, None if there is none.
+    Missing keys are caught instead of looking each key up with a default empty dict.
+    """
+    def get_name(result: Any) -> Optional[str]:
+        for path in name_paths:
+            value = result
+            try:
+                for key in path:
+                    value = value[key]
+            except (KeyError, TypeError):
+                continue
+            if value:
+                return value
+        return None
+    return get_name
+
+@dataclass(frozen=True)
+class ResolverSpec:
+    """
+    How the names of an endpoint are requested and read from its response.
+
+    Endpoints with response_key 'results' are requested with the codes in batches, the ones
+    with 'elements' return all of their codes in a single request.
+    """
+    url: str
+    label: str
+    name_paths: Tuple[Tuple[str, ...], ...]
+    response_key: str = 'results'
+    # Locale sent instead of the resolver's locale
+    locale: Optional[str] = None
+    send_locale: bool = True
+    get_name: Callable[[Any], Optional[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once for the endpoint, it is called for every result of every response
+        object.__setattr__(self, 'get_name', build_name_getter(self.name_paths))
+
+@lru_cache(maxsize=None)
+def build_url_parts(spec: ResolverSpec, locale: Optional[str]) -> Tuple[str, str]:
+    """
+    Build the parts of the URL of the endpoint before and after the codes of a chunk.
+    They only depend on the endpoint and the locale, so they are built once for the whole sync.
+    """
+    locale = spec.locale or (locale if spec.send_locale else None)
+    locale_param = f"locale={locale}" if locale else ""
+    if spec.response_key == 'results':
+        return f"{spec.url}?ids=List(", f"){'&' + locale_param if locale_param else ''}"
+    # Enumerations return all of their codes, they are not requested by ids
+    return (f"{spec.url}?{locale_param}" if locale_param else spec.url), ""
+
 class URNResolver(ABC):
     """Base class for URN resolvers."""
+
+    # A resolver is created for every resolve_urns call, its attributes don't need a __dict__
+    __slots__ = ('client', 'locale', 'max_workers', '_cache', '_url_prefix', '_url_suffix')
+
+    endpoint: str = ''
+    spec: ResolverSpec
     
-    def __init__(self, client: Any, locale: Optional[str] = None):
+    def __init__(self, client: Any, locale: Optional[str] = None, max_workers: int = MAX_CHUNK_WORKERS):
         self.client = client
         self.locale = locale
-        self._cache: Dict[str, str] = {}
+        self.max_workers = max_workers
+        self._cache = name_cache(self.endpoint, locale)
+        # Only the codes of the URL change between chunks, the rest of it is built once
+        self._url_prefix, self._url_suffix = build_url_parts(self.spec, locale)
     
-    @abstractmethod
     def resolve(self, urns: Set[str]) -> Dict[str, str]:
         """Resolve URNs to their names."""
-        pass
+        if not urns:
+            return {}
+
+        # _extract_code inlined, this runs for every URN of every resolve call
+        codes = {urn.rpartition(':')[2] for urn in urns}
+        resolved, misses = self._split_cached(codes)
+        if misses:
+            resolved.update(self._resolve_uncached(misses))
+        return resolved
     
     def _extract_code(self, urn: str) -> str:
         """Extract the code from a URN."""
-        return urn.split(':')[-1]
+        return urn.rpartition(':')[2]
     
     def _get_cached_value(self, code: str) -> Optional[str]:
         """Get a value from cache if it exists."""
@@ -29,324 +160,207 @@ class URNResolver(ABC):
         """Add a value to the cache."""
         self._cache[code] = name
 
-class FunctionsResolver(URNResolver):
-    """Resolver for job function URNs."""
-    
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        """Resolve a set of function URNs to their names."""
-        if not urns:
-            return {}
-            
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
-        
-    def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        """Resolve function codes in batches."""
-        resolved = {}
-        chunk_size = 150  # LinkedIn's batch limit
-        
-        # Split codes into chunks
-        code_chunks = [list(codes)[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
-        
-        for chunk in code_chunks:
-            try:
-                # For functions, we need to use a different URL format
-                locale_param = f"?locale={self.locale}" if self.locale else ""
-                url = f"https://api.linkedin.com/v2/functions{locale_param}"
-                
-                LOGGER.info(f"Making request to URL: {url}")
-                
-                headers = {'X-Restli-Protocol-Version': '2.0.0'}
-                response = self.client.get(url=url, endpoint="functions", headers=headers)
-                
-                if response and 'elements' in response:
-                    for element in response['elements']:
-                        if isinstance(element, dict):
-                            code = str(element.get('id'))
-                            if code in chunk:  # Only process codes we're interested in
-                                name = element.get('name', {}).get('localized', {}).get('en_US', code)
-                                resolved[code] = name
-                                self._add_to_cache(code, name)
-                            
-            except Exception as e:
-                if "429" in str(e):
-                    LOGGER.warning("Rate limit hit while resolving function names. Using codes as fallback.")
+    def _split_cached(self, codes: Set[str]) -> Tuple[Dict[str, str], Set[str]]:
+        """Split codes into the names already cached and the codes still to be requested."""
+        get_cached = self._cache.get
+        cached = {}
+        for code in codes:
+            name = get_cached(code)
+            if name is not None:
+                cached[code] = name
+        return cached, codes - cached.keys()
+
+    def _resolve_uncached(self, codes: Set[str]) -> Dict[str, str]:
+        """Resolve codes missing from the cache, each code is requested by one resolver at a time."""
+        resolved: Dict[str, str] = {}
+        pending: Dict[str, Future] = {}
+        owned: Dict[str, Future] = {}
+        with _INFLIGHT_LOCK:
+            for code in codes:
+                # The code may have been resolved since the cache was checked
+                name = self._cache.get(code)
+                if name is not None:
+                    resolved[code] = name
+                    continue
+                key = (self.endpoint, self.locale, code)
+                if key in _INFLIGHT:
+                    pending[code] = _INFLIGHT[key]
                 else:
-                    LOGGER.warning(f"Failed to resolve function names: {str(e)}")
-                
-                # Add unresolved codes from this chunk
-                for code in chunk:
-                    if code not in resolved:
-                        resolved[code] = code
-        
+                    owned[code] = _INFLIGHT[key] = Future()
+
+        try:
+            if owned:
+                resolved.update(self._batch_resolve(set(owned)))
+        finally:
+            with _INFLIGHT_LOCK:
+                for code in owned:
+                    del _INFLIGHT[(self.endpoint, self.locale, code)]
+            for code, future in owned.items():
+                future.set_result(resolved.get(code, code))
+
+        for code, future in pending.items():
+            resolved[code] = future.result()
         return resolved
 
-class TitlesResolver(URNResolver):
-    """Resolver for title URNs."""
-    
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        if not urns:
-            return {}
-            
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
-    
+    def _build_url(self, chunk: List[str]) -> str:
+        """Build the URL requesting the names of the chunk of codes."""
+        if self.spec.response_key == 'results':
+            return self._url_prefix + ','.join(chunk) + self._url_suffix
+        return self._url_prefix
+
     def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        """Resolve title codes in batches."""
+        """Resolve codes in batches, the batches are requested concurrently."""
+        # The whole enumeration is returned by a single request
+        if self.spec.response_key == 'elements' or len(codes) <= CHUNK_SIZE:
+            return self._fetch_chunk(list(codes))
+
+        chunk_count = -(-len(codes) // CHUNK_SIZE)
         resolved = {}
-        chunk_size = 150  # LinkedIn's batch limit
-        
-        # Split codes into chunks
-        code_chunks = [list(codes)[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
-        
-        for chunk in code_chunks:
-            try:
-                batch_params = ','.join(chunk)
-                locale_param = f"&locale={self.locale}" if self.locale else ""
-                url = f"https://api.linkedin.com/v2/titles?ids=List({batch_params}){locale_param}"
-                
-                LOGGER.info(f"Making batch request to URL: {url}")
-                
-                headers = {'X-Restli-Protocol-Version': '2.0.0'}
-                response = self.client.get(url=url, endpoint="titles", headers=headers)
-                
-                if response and 'results' in response:
-                    for code, result in response['results'].items():
-                        if isinstance(result, dict):
-                            # Try to get the localized name first, fall back to default name
-                            name = (result.get('name', {}).get('localized', {}).get('en_US') or 
-                                  result.get('name', {}).get('default') or 
-                                  code)
-                            resolved[code] = name
-                            self._add_to_cache(code, name)
-                        else:
-                            resolved[code] = code
-                            
-            except Exception as e:
-                if "429" in str(e):
-                    LOGGER.warning("Rate limit hit while batch resolving title names. Using codes as fallback.")
-                else:
-                    LOGGER.warning(f"Failed to batch resolve title names: {str(e)}")
-                
-                # Add unresolved codes from this chunk
-                for code in chunk:
-                    if code not in resolved:
-                        resolved[code] = code
-        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, chunk_count)) as executor:
+            for chunk_resolved in executor.map(self._fetch_chunk, self._iter_chunks(codes, CHUNK_SIZE)):
+                resolved.update(chunk_resolved)
         return resolved
 
-class GeoResolver(URNResolver):
-    """Resolver for geo URNs."""
-    
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        if not urns:
-            return {}
-            
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
-    
-    def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        """Resolve geo codes in batches."""
+    @staticmethod
+    def _iter_chunks(codes: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+        """Yield lists of chunk_size codes, in a single pass over the codes."""
+        code_iter = iter(codes)
+        while chunk := list(islice(code_iter, chunk_size)):
+            yield chunk
+
+    def _fetch_chunk(self, chunk: List[str]) -> Dict[str, str]:
+        """Request the names of a chunk of codes, the codes are their own names if the request fails."""
+        spec = self.spec
+        get_name = spec.get_name
         resolved = {}
-        chunk_size = 150  # LinkedIn's batch limit
-        
-        # Split codes into chunks
-        code_chunks = [list(codes)[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
-        
-        for chunk in code_chunks:
-            try:
-                batch_params = ','.join(chunk)
-                locale_param = f"&locale={self.locale}" if self.locale else ""
-                url = f"https://api.linkedin.com/v2/geo?ids=List({batch_params}){locale_param}"
-                
-                LOGGER.info(f"Making batch request to URL: {url}")
-                
-                headers = {'X-Restli-Protocol-Version': '2.0.0'}
-                response = self.client.get(url=url, endpoint="geo", headers=headers)
-                
-                if response and 'results' in response:
-                    for code, result in response['results'].items():
-                        if isinstance(result, dict):
-                            name = result.get('defaultLocalizedName', {}).get('value', code)
-                            resolved[code] = name
-                        else:
-                            resolved[code] = code
-                            
-            except Exception as e:
-                if "429" in str(e):
-                    LOGGER.warning("Rate limit hit while batch resolving geo names. Using codes as fallback.")
-                else:
-                    LOGGER.warning(f"Failed to batch resolve geo names: {str(e)}")
-                
-                # Add unresolved codes from this chunk
-                for code in chunk:
-                    if code not in resolved:
+        try:
+            url = self._build_url(chunk)
+
+            # The URL holds up to CHUNK_SIZE codes, it is only logged at DEBUG level
+            LOGGER.info("Requesting %s names of %d codes", self.endpoint, len(chunk))
+            LOGGER.debug("Making batch request to URL: %s", url)
+
+            response = self.client.get(url=url, endpoint=self.endpoint, headers=dict(HEADERS))
+
+            # The names are collected as pairs, the result and the cache are updated once
+            names = []
+            add_name = names.append
+            if response and spec.response_key == 'elements':
+                for element in response.get('elements', []):
+                    if isinstance(element, dict):
+                        raw_id = element.get('id')
+                        # str(None) would cache 'None' as a code
+                        if raw_id is None:
+                            continue
+                        code = raw_id if isinstance(raw_id, str) else str(raw_id)
+                        add_name((code, get_name(element) or code))
+                # The whole enumeration is cached, so the codes of later calls are not requested again
+                self._cache.update(names)
+                wanted = frozenset(chunk)
+                # Only return codes we're interested in
+                resolved.update(pair for pair in names if pair[0] in wanted)
+            elif response and 'results' in response:
+                for code, result in response['results'].items():
+                    if isinstance(result, dict):
+                        add_name((code, get_name(result) or code))
+                    else:
                         resolved[code] = code
-        
+                self._cache.update(names)
+                resolved.update(names)
+
+        except Exception as e:
+            # The client retries rate limited requests with backoff, this is raised once it gave up
+            if isinstance(e, Server429Error):
+                LOGGER.warning("Rate limit hit while batch resolving %s names. Using codes as fallback.", spec.label)
+            else:
+                LOGGER.warning("Failed to batch resolve %s names: %s", spec.label, e)
+
+            # Add unresolved codes from this chunk
+            for code in chunk:
+                if code not in resolved:
+                    resolved[code] = code
+
         return resolved
 
+class FunctionsResolver(URNResolver):
+    """Resolver for job function URNs."""
+
+    __slots__ = ()
+
+    endpoint = 'functions'
+    spec = ResolverSpec(url="https://api.linkedin.com/v2/functions", label="function",
+                        response_key='elements', name_paths=(('name', 'localized', 'en_US'),))
+
+class TitlesResolver(URNResolver):
+    """Resolver for title URNs."""
+
+    __slots__ = ()
+
+    endpoint = 'titles'
+    spec = ResolverSpec(url="https://api.linkedin.com/v2/titles", label="title",
+                        name_paths=(('name', 'localized', 'en_US'), ('name', 'default')))
+
+class GeoResolver(URNResolver):
+    """Resolver for geo URNs."""
+
+    __slots__ = ()
+
+    endpoint = 'geo'
+    spec = ResolverSpec(url="https://api.linkedin.com/v2/geo", label="geo",
+                        name_paths=(('defaultLocalizedName', 'value'),))
+
 class IndustriesResolver(URNResolver):
     """Resolver for industry URNs."""
-    
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        if not urns:
-            return {}
-            
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
-    
-    def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        """Resolve industry codes in batches."""
-        resolved = {}
-        chunk_size = 150  # LinkedIn's batch limit
-        
-        # Split codes into chunks
-        code_chunks = [list(codes)[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
-        
-        for chunk in code_chunks:
-            try:
-                batch_params = ','.join(chunk)
-                # For industries, we need to use a different locale format
-                locale_param = f"&locale=(language:en,country:US)"  # Always use en_US for industries
-                url = f"https://api.linkedin.com/v2/industries?ids=List({batch_params}){locale_param}"
-                
-                LOGGER.info(f"Making batch request to URL: {url}")
-                
-                headers = {'X-Restli-Protocol-Version': '2.0.0'}
-                response = self.client.get(url=url, endpoint="industries", headers=headers)
-                
-                if response and 'results' in response:
-                    for code, result in response['results'].items():
-                        if isinstance(result, dict):
-                            name = result.get('name', {}).get('localized', {}).get('en_US', code)
-                            resolved[code] = name
-                            self._add_to_cache(code, name)
-                        else:
-                            resolved[code] = code
-                            
-            except Exception as e:
-                if "429" in str(e):
-                    LOGGER.warning("Rate limit hit while batch resolving industry names. Using codes as fallback.")
-                else:
-                    LOGGER.warning(f"Failed to batch resolve industry names: {str(e)}")
-                
-                # Add unresolved codes from this chunk
-                for code in chunk:
-                    if code not in resolved:
-                        resolved[code] = code
-        
-        return resolved
+
+    __slots__ = ()
+
+    endpoint = 'industries'
+    # Always use en_US for industries
+    spec = ResolverSpec(url="https://api.linkedin.com/v2/industries", label="industry",
+                        name_paths=(('name', 'localized', 'en_US'),),
+                        locale="(language:en,country:US)")
 
 class OrganizationsResolver(URNResolver):
     """Resolver for organization URNs."""
-    
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        if not urns:
-            return {}
-            
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
-    
-    def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        """Resolve organization codes in batches."""
-        resolved = {}
-        chunk_size = 150  # LinkedIn's batch limit
-        
-        # Split codes into chunks
-        code_chunks = [list(codes)[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
-        
-        for chunk in code_chunks:
-            try:
-                batch_params = ','.join(chunk)
-                # For organizations, we don't need the locale parameter
-                url = f"https://api.linkedin.com/rest/organizationsLookup?ids=List({batch_params})"
-                
-                LOGGER.info(f"Making batch request to URL: {url}")
-                
-                headers = {'X-Restli-Protocol-Version': '2.0.0'}
-                response = self.client.get(url=url, endpoint="organizations", headers=headers)
-                
-                if response and 'results' in response:
-                    for code, result in response['results'].items():
-                        if isinstance(result, dict):
-                            # Try to get the localized name first, fall back to default name
-                            name = (result.get('name', {}).get('localized', {}).get('en_US') or 
-                                  result.get('localizedName') or 
-                                  code)
-                            resolved[code] = name
-                            self._add_to_cache(code, name)
-                        else:
-                            resolved[code] = code
-                            
-            except Exception as e:
-                if "429" in str(e):
-                    LOGGER.warning("Rate limit hit while batch resolving organization names. Using codes as fallback.")
-                else:
-                    LOGGER.warning(f"Failed to batch resolve organization names: {str(e)}")
-                
-                # Add unresolved codes from this chunk
-                for code in chunk:
-                    if code not in resolved:
-                        resolved[code] = code
-        
-        return resolved
+
+    __slots__ = ()
+
+    endpoint = 'organizations'
+    # For organizations, we don't need the locale parameter
+    spec = ResolverSpec(url="https://api.linkedin.com/rest/organizationsLookup", label="organization",
+                        name_paths=(('name', 'localized', 'en_US'), ('localizedName',)),
+                        send_locale=False)
 
 class SenioritiesResolver(URNResolver):
     """Resolver for seniority URNs."""
-    def resolve(self, urns: Set[str]) -> Dict[str, str]:
-        if not urns:
-            return {}
-        codes = {self._extract_code(urn) for urn in urns}
-        return self._batch_resolve(codes)
 
-    def _batch_resolve(self, codes: Set[str]) -> Dict[str, str]:
-        resolved = {}
-        try:
-            # Remove locale parameters, use default endpoint
-            url = "https://api.linkedin.com/v2/seniorities"
-            LOGGER.info(f"Making request to URL: {url}")
-            headers = {'X-Restli-Protocol-Version': '2.0.0'}
-            response = self.client.get(url=url, endpoint="seniorities", headers=headers)
-            LOGGER.info(f"Raw seniorities response: {response}")
-
-            if response and isinstance(response, dict):
-                elements = response.get('elements', [])
-                for element in elements:
-                    if isinstance(element, dict):
-                        code = str(element.get('id'))
-                        if code in codes:
-                            name = element.get('name', {}).get('localized', {}).get('en_US', code)
-                            resolved[code] = name
-                            self._add_to_cache(code, name)
-                            LOGGER.info(f"Resolved seniority {code} to {name}")
-        except Exception as e:
-            LOGGER.warning(f"Failed to resolve seniority names: {str(e)}")
-            import traceback
-            LOGGER.warning(f"Traceback: {traceback.format_exc()}")
-            for code in codes:
-                if code not in resolved:
-                    resolved[code] = code
-        return resolved
+    __slots__ = ()
+
+    endpoint = 'seniorities'
+    spec = ResolverSpec(url="https://api.linkedin.com/v2/seniorities", label="seniority",
+                        response_key='elements', name_paths=(('name', 'localized', 'en_US'),),
+                        send_locale=False)
 
 class URNResolverFactory:
     """Factory for creating appropriate URN resolvers."""
-    
-    @staticmethod
-    def create_resolver(endpoint: str, client: Any, locale: Optional[str] = None) -> URNResolver:
+
+    resolvers: Mapping[str, Type[URNResolver]] = MappingProxyType({
+        'functions': FunctionsResolver,
+        'titles': TitlesResolver,
+        'geo': GeoResolver,
+        'industries': IndustriesResolver,
+        'organizations': OrganizationsResolver,
+        'seniorities': SenioritiesResolver
+    })
+
+    @classmethod
+    def create_resolver(cls, endpoint: str, client: Any, locale: Optional[str] = None) -> URNResolver:
         """Create a resolver for the given endpoint."""
-        resolvers = {
-            'functions': FunctionsResolver,
-            'titles': TitlesResolver,
-            'geo': GeoResolver,
-            'industries': IndustriesResolver,
-            'organizations': OrganizationsResolver,
-            'seniorities': SenioritiesResolver
-        }
-        
-        resolver_class = resolvers.get(endpoint)
-        if not resolver_class:
-            raise ValueError(f"Unsupported endpoint: {endpoint}")
-            
+        try:
+            resolver_class = cls.resolvers[endpoint]
+        except KeyError:
+            raise ValueError(f"Unsupported endpoint: {endpoint}") from None
+
         return resolver_class(client, locale)
 
 def resolve_urns(client: Any, urns: Set[str], endpoint: str, locale: Optional[str] = None) -> Dict[str, str]:
@@ -363,4 +377,4 @@ def resolve_urns(client: Any, urns: Set[str], endpoint: str, locale: Optional[st
         Dictionary mapping codes to resolved names
     """
     resolver = URNResolverFactory.create_resolver(endpoint, client, locale)
-    return resolver.resolve(urns) 
\ No newline at end of file
+    return resolver.resolve(urns)
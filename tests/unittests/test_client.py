@@ -113,3 +113,16 @@ class TestLinkedInClient(unittest.TestCase):
         client.fetch_and_set_access_token()
         actual = client.access_token
         self.assertEqual(expected_access_token, actual)
+
+    def test_session_connection_pool(self, mocked_post, mock_write_token):
+        '''
+        Ensure that the session keeps enough connections alive for the concurrent account syncs
+        '''
+        client = _client.LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'accounts', 'config_path')
+
+        adapter = client._LinkedinClient__session.get_adapter('https://api.linkedin.com/rest')
+        self.assertEqual(adapter._pool_maxsize, _client.POOL_MAXSIZE)
+        self.assertTrue(adapter._pool_block)
+
+        oauth_adapter = client._LinkedinClient__session.get_adapter(_client.LINKEDIN_TOKEN_URI)
+        self.assertFalse(oauth_adapter._pool_block)
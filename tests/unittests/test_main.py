@@ -1,6 +1,10 @@
 import unittest
 from unittest import mock
-from tap_linkedin_ads import main
+from decimal import Decimal
+import json
+import singer
+from parameterized import parameterized
+from tap_linkedin_ads import main, format_message
 from singer.catalog import Catalog
 
 
@@ -77,3 +81,32 @@ class TestMainWorkflow(unittest.TestCase):
                                      config=self.mock_config,
                                      state=mock_state,
                                      catalog=self.mock_catalog)
+
+
+class TestFormatMessage(unittest.TestCase):
+    """
+    Test the orjson based Singer message formatting.
+    """
+
+    def test_format_record_message(self):
+        """
+        Test that `format_message` produces the same JSON document as singer-python.
+        """
+        message = singer.RecordMessage("accounts", {"id": 1, "name": "é", "total_budget": Decimal("1.5"), "status": None})
+        formatted = format_message(message)
+
+        # Verify the formatted message
+        self.assertEqual(json.loads(formatted), {"type": "RECORD", "stream": "accounts",
+                                                 "record": {"id": 1, "name": "é", "total_budget": 1.5, "status": None}})
+
+    @parameterized.expand([
+        ['test_ensure_ascii', True, '{"type":"RECORD","stream":"accounts","record":{"name":"\\u00e9"}}'],
+        ['test_not_ensure_ascii', False, '{"type":"RECORD","stream":"accounts","record":{"name":"é"}}'],
+    ])
+    def test_format_message_ensure_ascii(self, name, ensure_ascii, expected_message):
+        """
+        Test that non-ASCII characters are only escaped if `ensure_ascii` is true.
+        """
+        message = singer.RecordMessage("accounts", {"name": "é"})
+
+        self.assertEqual(format_message(message, ensure_ascii=ensure_ascii), expected_message)
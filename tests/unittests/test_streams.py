@@ -1,11 +1,13 @@
 import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
-from singer import utils
+from singer import utils, metadata
 from parameterized import parameterized
 import unittest
 from singer.schema import Schema
 from singer.catalog import Catalog, CatalogEntry
-from tap_linkedin_ads.streams import split_into_chunks, get_next_url, shift_sync_window, merge_responses, sync_analytics_endpoint, STREAMS, LinkedInAds
+from tap_linkedin_ads.streams import split_into_chunks, get_next_url, shift_sync_window, next_window_size, merge_responses, sync_analytics_endpoint, selected_fields, write_bookmark, flush_state, STREAMS, LinkedInAds
 import tap_linkedin_ads.client as _client
 from tap_linkedin_ads.client import LinkedinClient
 
@@ -125,11 +127,37 @@ class TestStreamsUtils(unittest.TestCase):
         """
         mock_next_url.side_effect = next_url
         client = _client.LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'config_path')
-        data = list(sync_analytics_endpoint(client, "stream", "path", "query=query"))
+        data = list(sync_analytics_endpoint(client, "stream", "path", {"query": "query"}))
 
         # Verify that get method of client is called expected times.
         self.assertEqual(expected_call_count, mock_get.call_count)
 
+    @mock.patch('tap_linkedin_ads.client.LinkedinClient.request', return_value={})
+    def test_sync_analytics_endpoint_query_string(self, mock_get):
+        """
+        Test that sync_analytics_endpoint encodes the params, keeping the Rest.li syntax characters.
+        """
+        client = _client.LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'accounts', 'config_path')
+        params = {'start': 0, 'campaigns[0]': 'urn:li:sponsoredCampaign:1', 'fields': 'clicks,dateRange', 'name': 'a b&c'}
+        list(sync_analytics_endpoint(client, "stream", "adAnalytics", params))
+
+        self.assertEqual(mock_get.call_args.kwargs['url'],
+                         'https://api.linkedin.com/rest/adAnalytics?start=0&campaigns[0]=urn:li:sponsoredCampaign:1'
+                         '&fields=clicks,dateRange&name=a+b%26c')
+
+
+    @parameterized.expand([
+        ['test_sparse_window', 7, 100, 90, 14],
+        ['test_sparse_window_capped', 60, 100, 90, 90],
+        ['test_regular_window', 30, 5000, 90, 30],
+        ['test_dense_window', 30, 9000, 90, 15],
+        ['test_dense_single_day_window', 1, 9000, 90, 1],
+    ])
+    def test_next_window_size(self, name, window_size, record_count, max_window_size, expected_window_size):
+        """
+        Test that the analytics window grows after sparse windows and shrinks after dense windows.
+        """
+        self.assertEqual(next_window_size(window_size, record_count, max_window_size), expected_window_size)
 
     @parameterized.expand([
         ["test_single_page", [], None],
@@ -151,6 +179,23 @@ class TestStreamsUtils(unittest.TestCase):
         # Verify the next page url
         self.assertEqual(expected_url, actual_url)
 
+    @parameterized.expand([
+        ["test_first_page", "https://api.linkedin.com/rest/adCampaigns?pageSize=100&q=search", "token_2",
+         "https://api.linkedin.com/rest/adCampaigns?pageSize=100&q=search&pageToken=token_2"],
+        ["test_next_page", "https://api.linkedin.com/rest/adCampaigns?pageSize=100&pageToken=token_1&q=search", "token_2",
+         "https://api.linkedin.com/rest/adCampaigns?pageSize=100&pageToken=token_2&q=search"],
+        ["test_last_page", "https://api.linkedin.com/rest/adCampaigns?pageSize=100&pageToken=token_1&q=search", None, None]
+    ])
+    def test_get_next_url_cursor_pagination(self, name, next_url, next_page_token, expected_url):
+        """
+        Test that get_next_url sets or replaces the `pageToken` param for cursor based pagination
+        """
+        data = {'metadata': {'nextPageToken': next_page_token}}
+        actual_url = get_next_url("campaigns", next_url, data)
+
+        # Verify the next page url
+        self.assertEqual(expected_url, actual_url)
+
     @parameterized.expand([
         ['test_shift_sync_window_non_boundary', 11, 10],
         ['test_shift_sync_window_boundary', 10, 31]
@@ -219,6 +264,21 @@ class TestStreamsUtils(unittest.TestCase):
 
         self.assertEqual(expected_output, actual_output)
 
+    def test_merge_responses_merges_in_place(self):
+        """
+        Test merge_responses merges the elements of a primary key into the first element, without copying it.
+        """
+        first = {'dateRange': {'start': {'year': 2020, 'month': 10, 'day': 1}},
+                 'a': 1, 'pivotValues': ['urn:li:sponsoredCampaign:123456789']}
+        second = {'dateRange': {'start': {'year': 2020, 'month': 10, 'day': 1}},
+                  'b': 2, 'pivotValues': ['urn:li:sponsoredCampaign:123456789']}
+
+        actual_output = merge_responses("CAMPAIGNS", [[first], [second]])
+
+        record = actual_output[('urn:li:sponsoredCampaign:123456789', '2020-10-1')]
+        self.assertIs(record, first)
+        self.assertEqual(record['b'], 2)
+
     def test_merge_responses_with_overlap(self):
         """
         Test merge_responses function with records of same date range value
@@ -246,6 +306,59 @@ class TestStreamsUtils(unittest.TestCase):
         # Verify that merge_responses function merge records by primary with same date range value.
         self.assertEqual(expected_output, actual_output)
 
+    @mock.patch('tap_linkedin_ads.streams.metadata.to_map', wraps=metadata.to_map)
+    def test_selected_fields_cached_per_catalog_entry(self, mock_to_map):
+        """
+        Test that `selected_fields` computes the fields once for the same catalog entry.
+        """
+        catalog_entry = CatalogEntry(
+            stream='campaigns',
+            tap_stream_id='campaigns',
+            schema=Schema(properties={'id': Schema(type='integer'), 'name': Schema(type='string')}),
+            metadata=[
+                {'metadata': {'inclusion': 'automatic'}, 'breadcrumb': ['properties', 'id']},
+                {'metadata': {'inclusion': 'available', 'selected': True}, 'breadcrumb': ['properties', 'name']}])
+        first = selected_fields(catalog_entry)
+        second = selected_fields(catalog_entry)
+
+        # Verify that the metadata is only read once and the same fields are returned
+        self.assertEqual(mock_to_map.call_count, 1)
+        self.assertEqual(first, ['id', 'name'])
+        self.assertIs(first, second)
+
+    @mock.patch('singer.write_state')
+    def test_write_bookmark_defers_state_output(self, mock_write_state):
+        """
+        Test that `write_bookmark` only updates the state and `flush_state` emits it once.
+        """
+        state = {}
+        write_bookmark(state, '2020-10-01T00:00:00Z', 'creatives')
+        write_bookmark(state, '2020-10-02T00:00:00Z', 'ad_analytics_by_campaign')
+
+        # Verify that no state message is written while bookmarks are updated
+        self.assertEqual(mock_write_state.call_count, 0)
+
+        flush_state(state)
+
+        # Verify that a single state message with both bookmarks is written
+        mock_write_state.assert_called_once_with({'bookmarks': {'creatives': '2020-10-01T00:00:00Z',
+                                                                'ad_analytics_by_campaign': '2020-10-02T00:00:00Z'}})
+
+    @mock.patch('tap_linkedin_ads.streams.batch_resolve_urns', return_value={'101': 'United States'})
+    def test_merge_responses_resolves_names(self, mock_resolve):
+        """
+        Test that merge_responses names the records with the names returned by the resolver.
+        """
+        data = [[{'dateRange': {'start': {'year': 2020, 'month': 10, 'day': 1}}, 'pivotValues': ['urn:li:geo:101']},
+                 {'dateRange': {'start': {'year': 2020, 'month': 10, 'day': 1}}, 'pivotValues': ['urn:li:geo:102']}]]
+
+        records = merge_responses('MEMBER_COUNTRY_V2', data, 'client', 'ad_analytics_by_member_country_v2')
+
+        # Verify that all the URNs are sent to the resolver, the codes without a name are named by themselves
+        self.assertEqual(mock_resolve.call_args[0][1], {'urn:li:geo:101', 'urn:li:geo:102'})
+        self.assertEqual(records[('urn:li:geo:101', '2020-10-1')]['pivot_value_name'], 'United States')
+        self.assertEqual(records[('urn:li:geo:102', '2020-10-1')]['pivot_value_name'], '102')
+
 class TestLinkedInAds(unittest.TestCase):
     """
     Test LinkedInAds class's functionality.
@@ -336,28 +449,150 @@ class TestLinkedInAds(unittest.TestCase):
         # Verify total no of write_schema function call. sync_endpoint calls write_schema single time for each child.
         self.assertEqual(mock_write_schema.call_count, expected_write_schema_count)
 
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.get_bookmark", return_value="2019-06-01T00:00:00Z")
+    @mock.patch("tap_linkedin_ads.client.LinkedinClient.request")
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records")
+    def test_sync_endpoint_multiple_accounts(self, mock_process_records, mock_client, mock_get_bookmark):
+        """
+        Test sync_endpoint syncs every account and merges the record counts and bookmarks of the accounts.
+        """
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', '1,2,3', 'config_path')
+        mock_client.return_value = {'metadata': {}, 'elements': [{'id': 1}]}
+        mock_process_records.side_effect = lambda **kwargs: (
+            "2019-07-{}T15:07:00.000000Z".format(10 + len(mock_process_records.call_args_list)), 2)
+
+        actual_total_record, actual_max_bookmark = STREAMS['campaigns']().sync_endpoint(
+            client, CATALOG, {}, 100, '2019-06-01T00:00:00Z', ['campaigns'], 7, account_list=["1", "2", "3"])
+
+        # Verify each account is requested
+        self.assertEqual(mock_client.call_count, 3)
+        self.assertEqual(actual_total_record, 6)
+        self.assertEqual(actual_max_bookmark, "2019-07-13T15:07:00.000000Z")
+
+
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.sync_ad_analytics",
+                side_effect=[(1, "2019-07-20T00:00:00.000000Z"), (1, "2019-07-10T00:00:00.000000Z")])
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.get_bookmark", return_value="2019-06-01T00:00:00Z")
+    @mock.patch("tap_linkedin_ads.client.LinkedinClient.request",
+                return_value={'metadata': {}, 'elements': [{'id': 1}]})
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records", return_value=("2019-07-31T15:07:00.000000Z", 1))
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.write_schema")
+    def test_sync_endpoint_child_bookmarks_of_accounts(self, mock_write_schema, mock_process_records, mock_client,
+                                                       mock_get_bookmark, mock_sync_ad_analytics):
+        """
+        Test that the max bookmark of a child stream over all the accounts is written in the state.
+        """
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', '1,2', 'config_path')
+        state = {}
+
+        STREAMS['campaigns']().sync_endpoint(
+            client, CATALOG, state, 100, '2019-06-01T00:00:00Z', ['campaigns', 'ad_analytics_by_campaign'], 7,
+            account_list=["1", "2"])
+
+        # Verify the schema of the child is written once for all the accounts
+        self.assertEqual(mock_write_schema.call_count, 1)
+        self.assertEqual(mock_sync_ad_analytics.call_count, 2)
+        self.assertEqual(state['bookmarks']['ad_analytics_by_campaign'], "2019-07-20T00:00:00.000000Z")
+
+    @parameterized.expand([
+        ['test_single_campaign', 1],
+        ['test_two_campaigns', 2],
+        ['test_more_campaigns_than_batch_size', 21],
+    ])
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.get_bookmark", return_value="2019-06-01T00:00:00Z")
+    @mock.patch("tap_linkedin_ads.client.LinkedinClient.request")
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records", return_value=("2019-06-01T00:00:00Z", 1))
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.write_schema")
+    def test_sync_endpoint_parent_batches(self, name, campaign_count, mock_write_schema, mock_process_records,
+                                          mock_client, mock_get_bookmark):
+        """
+        Test that the children of the campaigns are synced for batches of at most 20 campaigns.
+        """
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', '1', 'config_path')
+        campaign_ids = list(range(1, campaign_count + 1))
+        mock_client.side_effect = lambda method, url, **kwargs: (
+            {'elements': []} if '/creatives?' in url else
+            {'metadata': {}, 'elements': [{'id': campaign_id} for campaign_id in campaign_ids]})
+        analytics_calls = []
+
+        def sync_ad_analytics(stream_obj, **kwargs):
+            analytics_calls.append((dict(stream_obj.params), kwargs['parent_id']))
+            return 0, "2019-06-01T00:00:00Z"
+
+        with mock.patch.object(LinkedInAds, 'sync_ad_analytics', autospec=True, side_effect=sync_ad_analytics):
+            STREAMS['campaigns']().sync_endpoint(
+                client, CATALOG, {}, 100, '2019-06-01T00:00:00Z',
+                ['campaigns', 'creatives', 'ad_analytics_by_campaign'], 7, account_list=["1"])
+
+        batches = [campaign_ids[idx:idx + 20] for idx in range(0, campaign_count, 20)]
+        # Verify the creatives of each batch are requested with the encoded URNs of its campaigns
+        creatives_urls = [call[1]['url'] for call in mock_client.call_args_list if '/creatives?' in call[1]['url']]
+        self.assertEqual(creatives_urls, [
+            'https://api.linkedin.com/rest/adAccounts/1/creatives?pageSize=100&q=criteria&campaigns=List({})'
+            '&sortOrder=ASCENDING'.format(','.join('urn%3Ali%3AsponsoredCampaign%3A{}'.format(campaign_id)
+                                                   for campaign_id in batch))
+            for batch in batches])
+        # Verify the analytics of each batch are requested with only the campaigns of the batch,
+        # and for a single parent only when the batch has one campaign
+        self.assertEqual(analytics_calls, [
+            ({'q': 'analytics', 'pivot': 'CAMPAIGN', 'timeGranularity': 'DAILY', 'count': 10000,
+              **{'campaigns[{}]'.format(idx): 'urn:li:sponsoredCampaign:{}'.format(campaign_id)
+                 for idx, campaign_id in enumerate(batch)}},
+             batch[0] if len(batch) == 1 else None)
+            for batch in batches])
+
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds._sync_one_account",
+                return_value=(0, '2019-06-01T00:00:00Z'))
+    def test_sync_endpoint_creatives_url(self, mock_sync_one_account):
+        """
+        Test that the params of the creatives are sent in the query string exactly as they are defined.
+        """
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', '1', 'config_path')
+
+        STREAMS['creatives']().sync_endpoint(
+            client, CATALOG, {}, 100, '2019-06-01T00:00:00Z', ['creatives'], 7, account_list=["1"])
+
+        self.assertEqual(mock_sync_one_account.call_args[0][-1],
+                         'https://api.linkedin.com/rest/adAccounts/1/creatives?pageSize=100&q=criteria'
+                         '&campaigns=List(urn%3Ali%3AsponsoredCampaign%3A{})&sortOrder=ASCENDING')
+
 
 
+    @mock.patch('requests.Session.request')
+    def test_sync_endpoint_does_not_change_headers(self, mock_request):
+        """
+        Test that the headers added by the client to a request are not kept in the headers of the stream.
+        """
+        mock_request.return_value = mock.Mock(status_code=200, content=b'{"elements": []}')
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', '1,2', 'config_path')
+        stream_obj = STREAMS['creatives']()
+
+        stream_obj.sync_endpoint(
+            client, CATALOG, {}, 100, '2019-06-01T00:00:00Z', ['creatives'], 7, account_list=["1", "2"])
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args[1]['headers']['Authorization'], 'Bearer access_token')
+        self.assertEqual(stream_obj.headers, dict(STREAMS['creatives'].headers))
+
     @parameterized.expand([
-        ['test_no_record', 0, '2022-08-01T00:00:00Z', {'elements': []}],
-        ['test_multiple_record', 1, '2022-08-01T00:00:00Z', {'elements': [{'id': 1}]}]
+        ['test_no_record', 0, '2022-08-01T00:00:00Z', {}],
+        ['test_multiple_record', 1, '2022-08-01T00:00:00Z', {('urn:li:sponsoredCampaign:1', '2022-8-1'): {'id': 1}}]
     ])
     @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records")
     @mock.patch("tap_linkedin_ads.streams.shift_sync_window", return_value=('', '', ''))
-    @mock.patch("tap_linkedin_ads.streams.transform_json")
     @mock.patch("tap_linkedin_ads.streams.sync_analytics_endpoint")
     @mock.patch("tap_linkedin_ads.streams.merge_responses")
-    def test_sync_ad_analytics(self, name, expected_record_count, expected_max_bookmark, mock_tranform_data,
-                               mock_merge_response, mock_endpoint, mock_transform, mock_shift_windows, mock_process_record):
+    def test_sync_ad_analytics(self, name, expected_record_count, expected_max_bookmark, merged_records,
+                               mock_merge_response, mock_endpoint, mock_shift_windows, mock_process_record):
         """
         Test that `sync_ad_analytics` function work properly for zero records as well as multiple records.
         """
 
-        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'config_path')
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'accounts', 'config_path')
         bookmark='2022-08-01T00:00:00Z'
         date_window_size = 7
 
-        mock_transform.return_value = mock_tranform_data
+        mock_merge_response.return_value = merged_records
         mock_process_record.return_value = (expected_max_bookmark, expected_record_count)
         actual_record_count, actual_max_bookmark =  AD_ANALYTICS_BY_CAMPAIGN.sync_ad_analytics(client, CATALOG, bookmark, date_window_size)
 
@@ -366,6 +601,141 @@ class TestLinkedInAds(unittest.TestCase):
         # Verify total no of records
         self.assertEqual(actual_record_count, expected_record_count)
 
+    @mock.patch("tap_linkedin_ads.streams.shift_sync_window", return_value=('', '', ''))
+    @mock.patch("tap_linkedin_ads.streams.sync_analytics_endpoint", return_value=[])
+    def test_sync_ad_analytics_requests_selected_fields(self, mock_endpoint, mock_shift_windows):
+        """
+        Test that `sync_ad_analytics` only requests chunks of the selected fields which the API accepts.
+        """
+        catalog = Catalog(streams=[
+            CatalogEntry(
+                stream='ad_analytics_by_creative',
+                tap_stream_id='ad_analytics_by_creative',
+                schema=Schema(
+                    properties={
+                        'creative_id': Schema(type='integer'),
+                        'start_at': Schema(type='string'),
+                        'clicks': Schema(type='integer'),
+                        'impressions': Schema(type='integer'),
+                        'cost_in_usd': Schema(type='number')}),
+                metadata=[
+                    {'metadata': {'inclusion': 'automatic'}, 'breadcrumb': ['properties', 'creative_id']},
+                    {'metadata': {'inclusion': 'automatic'}, 'breadcrumb': ['properties', 'start_at']},
+                    {'metadata': {'inclusion': 'available', 'selected': True}, 'breadcrumb': ['properties', 'clicks']},
+                    {'metadata': {'inclusion': 'available', 'selected': False}, 'breadcrumb': ['properties', 'impressions']},
+                    {'metadata': {'inclusion': 'available', 'selected': True}, 'breadcrumb': ['properties', 'cost_in_usd']}
+            ])])
+
+        STREAMS['ad_analytics_by_creative']().sync_ad_analytics(None, catalog, '2022-08-01T00:00:00Z', 7)
+
+        requested_fields = [call.args[3]['fields'] for call in mock_endpoint.call_args_list]
+        self.assertEqual(requested_fields, ['dateRange,pivotValues', 'dateRange,pivotValues,clicks,costInUsd'])
+
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.fetch_analytics_window", return_value={})
+    def test_sync_ad_analytics_stops_at_today(self, mock_fetch_window):
+        """
+        Test that `sync_ad_analytics` does not request another window once a window ends today.
+        """
+        today = datetime.date.today()
+        bookmark = today.strftime('%Y-%m-%dT00:00:00Z')
+
+        AD_ANALYTICS_BY_CAMPAIGN.sync_ad_analytics(None, CATALOG, bookmark, 30)
+
+        self.assertEqual(mock_fetch_window.call_count, 1)
+        window_params = mock_fetch_window.call_args.args[3]
+        window_end = datetime.date(window_params['dateRange.end.year'],
+                                   window_params['dateRange.end.month'],
+                                   window_params['dateRange.end.day'])
+        self.assertEqual(window_end, today)
+
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records", return_value=("2022-08-01T00:00:00Z", 1))
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.fetch_analytics_window")
+    def test_sync_ad_analytics_prefetches_adapted_window(self, mock_fetch_window, mock_process_records):
+        """
+        Test that the next window is fetched with the window size adapted to the records of the current window.
+        """
+        window_days = []
+
+        def fetch_analytics_window(client, chunk_executor, chunk_fields, window_params):
+            window_days.append((datetime.date(window_params['dateRange.end.year'],
+                                              window_params['dateRange.end.month'],
+                                              window_params['dateRange.end.day']) -
+                                datetime.date(window_params['dateRange.start.year'],
+                                              window_params['dateRange.start.month'],
+                                              window_params['dateRange.start.day'])).days)
+            # The first window is dense, the next ones are sparse
+            return {key: {} for key in range(9000)} if len(window_days) == 1 else {}
+
+        mock_fetch_window.side_effect = fetch_analytics_window
+        bookmark = (datetime.date.today() - datetime.timedelta(days=100)).strftime('%Y-%m-%dT00:00:00Z')
+
+        AD_ANALYTICS_BY_CAMPAIGN.sync_ad_analytics(None, CATALOG, bookmark, 8)
+
+        # Verify the window after the dense one is halved, and the windows after the sparse ones are doubled
+        self.assertEqual(window_days[:4], [8, 4, 8, 16])
+
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.process_records", return_value=("2022-08-01T00:00:00Z", 1))
+    @mock.patch("tap_linkedin_ads.streams.LinkedInAds.fetch_analytics_window")
+    def test_sync_ad_analytics_raises_prefetched_window_error(self, mock_fetch_window, mock_process_records):
+        """
+        Test that an error raised while prefetching the next window is raised once the window is reached.
+        """
+        mock_fetch_window.side_effect = [{('urn:li:sponsoredCampaign:1', '2022-8-1'): {}},
+                                         _client.LinkedInInternalServiceError('error')]
+
+        with self.assertRaises(_client.LinkedInInternalServiceError):
+            AD_ANALYTICS_BY_CAMPAIGN.sync_ad_analytics(None, CATALOG, '2022-08-01T00:00:00Z', 7)
+
+        # Verify the records of the window fetched before the error are processed
+        self.assertEqual(mock_process_records.call_count, 1)
+        self.assertEqual(mock_fetch_window.call_count, 2)
+
+    @mock.patch("tap_linkedin_ads.streams.merge_responses", side_effect=lambda pivot, data, client, stream_name: data)
+    @mock.patch("tap_linkedin_ads.streams.sync_analytics_endpoint")
+    def test_fetch_analytics_window_merges_chunks_in_order(self, mock_endpoint, mock_merge_responses):
+        """
+        Test that the pages of the field chunks are merged in the order of the chunks, whichever is fetched first.
+        """
+        def sync_analytics_endpoint(client, stream_name, path, params):
+            if params['fields'] == 'dateRange,pivotValues':
+                # The first chunk is fetched last
+                time.sleep(0.1)
+            return [{'elements': [params['fields'] + ' page 1']},
+                    {'elements': []},
+                    {'elements': [params['fields'] + ' page 2']}]
+
+        mock_endpoint.side_effect = sync_analytics_endpoint
+        chunk_fields = ['dateRange,pivotValues', 'dateRange,pivotValues,clicks', 'dateRange,pivotValues,costInUsd']
+
+        with ThreadPoolExecutor(max_workers=3) as chunk_executor:
+            responses = AD_ANALYTICS_BY_CAMPAIGN.fetch_analytics_window(
+                None, chunk_executor, chunk_fields, {'pivot': 'CAMPAIGN'})
+
+        self.assertEqual(responses, [[fields + page] for fields in chunk_fields for page in (' page 1', ' page 2')])
+        # Verify each chunk is requested with the window params and its fields
+        self.assertEqual(sorted(call.args[3]['fields'] for call in mock_endpoint.call_args_list), sorted(chunk_fields))
+        self.assertTrue(all(call.args[3]['pivot'] == 'CAMPAIGN' for call in mock_endpoint.call_args_list))
+
+    @mock.patch("tap_linkedin_ads.streams.merge_responses")
+    @mock.patch("tap_linkedin_ads.streams.sync_analytics_endpoint")
+    def test_fetch_analytics_window_raises_chunk_error(self, mock_endpoint, mock_merge_responses):
+        """
+        Test that an error raised while fetching one of the field chunks is raised to the caller.
+        """
+        def sync_analytics_endpoint(client, stream_name, path, params):
+            if params['fields'] == 'dateRange,pivotValues,clicks':
+                raise _client.LinkedInInternalServiceError('error')
+            return [{'elements': [params['fields']]}]
+
+        mock_endpoint.side_effect = sync_analytics_endpoint
+
+        with ThreadPoolExecutor(max_workers=2) as chunk_executor, \
+                self.assertRaises(_client.LinkedInInternalServiceError):
+            AD_ANALYTICS_BY_CAMPAIGN.fetch_analytics_window(
+                None, chunk_executor, ['dateRange,pivotValues', 'dateRange,pivotValues,clicks'], {'pivot': 'CAMPAIGN'})
+
+        mock_merge_responses.assert_not_called()
+
     @mock.patch('singer.write_schema', side_effect=OSError('error'))
     @mock.patch('tap_linkedin_ads.streams.LOGGER.info')
     def test_write_schema(self, mock_logger, mock_write_schema):
@@ -387,3 +757,15 @@ class TestLinkedInAds(unittest.TestCase):
             ACCOUNT_OBJ.write_record([], '')
 
         mock_logger.assert_called_with('record: %s', [])
+
+    def test_params_and_headers_per_instance(self):
+        """
+        Test that updating the params or headers of a stream object does not change the class dicts.
+        """
+        creatives = STREAMS['creatives']()
+        creatives.params['campaigns'] = 'List(urn%3Ali%3AsponsoredCampaign%3A1)'
+        creatives.headers['Authorization'] = 'Bearer token'
+
+        self.assertEqual(STREAMS['creatives'].params['campaigns'], 'List(urn%3Ali%3AsponsoredCampaign%3A{})')
+        self.assertNotIn('Authorization', STREAMS['creatives'].headers)
+        self.assertEqual(STREAMS['creatives']().params['campaigns'], 'List(urn%3Ali%3AsponsoredCampaign%3A{})')
@@ -5,7 +5,7 @@ from parameterized import parameterized
 from tap_linkedin_ads.transform import (convert, snake_case_to_camel_case, convert_array, convert_json,
                                         transform_accounts, transform_analytics, transform_json,
                                         transform_campaigns, transform_creatives, transform_audit_fields,
-                                        transform_urn, transform_data, string_to_decimal)
+                                        transform_urn, transform_data, transform_records, string_to_decimal)
 
 
 class TestConvertCamelcaseToSnakeCase(unittest.TestCase):
@@ -499,3 +499,22 @@ class TestTransformJson(unittest.TestCase):
         # Verify expected dictionary was returned
         self.assertEqual(returned_dict, test_dict)
 
+
+class TestTransformRecords(unittest.TestCase):
+    """
+    Test `transform_records` function.
+    """
+
+    def test_transform_records(self):
+        """
+        Test that `transform_records` yields each record converted and transformed.
+        """
+        records = [{"id": 1, "reference": "urn:li:organization:2", "changeAuditStamps": {"lastModified": {"time": 10}}}]
+        transformed = transform_records(records, "accounts")
+
+        # Verify the transformed records
+        self.assertEqual(list(transformed), [{"id": 1,
+                                              "reference": "urn:li:organization:2",
+                                              "reference_organization_id": 2,
+                                              "change_audit_stamps": {"last_modified": {"time": 10}},
+                                              "last_modified_time": 10}])
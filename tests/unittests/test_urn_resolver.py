@@ -0,0 +1,247 @@
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+from parameterized import parameterized
+from tap_linkedin_ads import urn_resolver
+from tap_linkedin_ads.client import LinkedinClient, LinkedInRateLimitExceeededError
+from tap_linkedin_ads.urn_resolver import URN_CACHE, LRUCache, build_name_getter, resolve_urns
+
+GEO_RESPONSE = {
+    'results': {
+        '101': {'defaultLocalizedName': {'value': 'United States'}},
+        '102': {'defaultLocalizedName': {'value': 'France'}}
+    }
+}
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Test `LRUCache` class to bound the number of cached names.
+    """
+
+    def test_least_recently_used_is_dropped(self):
+        """
+        Test that the least recently read or written name is dropped once maxsize is exceeded.
+        """
+        cache = LRUCache(2)
+        cache['101'] = 'United States'
+        cache['102'] = 'France'
+        cache.get('101')
+        cache.update({'103': 'Spain'})
+
+        self.assertEqual(dict(cache), {'101': 'United States', '103': 'Spain'})
+
+
+class TestBuildNameGetter(unittest.TestCase):
+    """
+    Test `build_name_getter` function to read the name of a result.
+    """
+
+    @parameterized.expand([
+        ['test_first_path', {'name': {'localized': {'en_US': 'Sales'}, 'default': 'Ventes'}}, 'Sales'],
+        ['test_second_path', {'name': {'default': 'Ventes'}}, 'Ventes'],
+        ['test_empty_name', {'name': {'localized': {'en_US': ''}, 'default': 'Ventes'}}, 'Ventes'],
+        ['test_not_a_dict', {'name': 'Sales'}, None],
+        ['test_no_name', {}, None],
+    ])
+    def test_build_name_getter(self, name, result, expected_name):
+        """
+        Test that the first name found at the paths is returned, None if there is none.
+        """
+        get_name = build_name_getter((('name', 'localized', 'en_US'), ('name', 'default')))
+
+        self.assertEqual(get_name(result), expected_name)
+
+
+@mock.patch.dict(URN_CACHE, clear=True)
+class TestResolveUrns(unittest.TestCase):
+    """
+    Test `resolve_urns` function to resolve URNs to their names.
+    """
+
+    def test_resolve_urns(self):
+        """
+        Test that the names of the URNs are returned by their code.
+        """
+        client = mock.Mock()
+        client.get.return_value = GEO_RESPONSE
+
+        resolved = resolve_urns(client, {'urn:li:geo:101', 'urn:li:geo:102'}, 'geo', '(language:en,country:US)')
+
+        self.assertEqual(resolved, {'101': 'United States', '102': 'France'})
+
+    def test_resolve_urns_reuses_cached_names(self):
+        """
+        Test that names resolved by a previous call are not requested again.
+        """
+        client = mock.Mock()
+        client.get.return_value = GEO_RESPONSE
+
+        resolve_urns(client, {'urn:li:geo:101', 'urn:li:geo:102'}, 'geo', '(language:en,country:US)')
+        resolved = resolve_urns(client, {'urn:li:geo:101'}, 'geo', '(language:en,country:US)')
+
+        # Verify that the second call is served from the cache
+        self.assertEqual(client.get.call_count, 1)
+        self.assertEqual(resolved, {'101': 'United States'})
+
+    def test_resolve_urns_does_not_cache_failures(self):
+        """
+        Test that codes returned as their own name because the request failed are requested again.
+        """
+        client = mock.Mock()
+        client.get.side_effect = [Exception('error'), {'results': {'101': GEO_RESPONSE['results']['101']}}]
+
+        first = resolve_urns(client, {'urn:li:geo:101'}, 'geo', '(language:en,country:US)')
+        second = resolve_urns(client, {'urn:li:geo:101'}, 'geo', '(language:en,country:US)')
+
+        self.assertEqual(first, {'101': '101'})
+        self.assertEqual(second, {'101': 'United States'})
+
+    @mock.patch('tap_linkedin_ads.urn_resolver.LOGGER.warning')
+    def test_resolve_urns_rate_limited(self, mock_warning):
+        """
+        Test that the codes are returned as their own names once the client gave up on a rate limited request.
+        """
+        client = mock.Mock()
+        client.get.side_effect = LinkedInRateLimitExceeededError('rate limited')
+
+        resolved = resolve_urns(client, {'urn:li:geo:101'}, 'geo', '(language:en,country:US)')
+
+        self.assertEqual(resolved, {'101': '101'})
+        mock_warning.assert_called_once_with(
+            "Rate limit hit while batch resolving %s names. Using codes as fallback.", 'geo')
+
+    def test_resolve_urns_waits_for_pending_requests(self):
+        """
+        Test that a code already requested by another resolver is not requested again.
+        """
+        client = mock.Mock()
+        client.get.return_value = {'results': {'101': GEO_RESPONSE['results']['101']}}
+        pending = Future()
+        pending.set_result('France')
+
+        with mock.patch.dict(urn_resolver._INFLIGHT, {('geo', '(language:en,country:US)', '102'): pending}):
+            resolved = resolve_urns(client, {'urn:li:geo:101', 'urn:li:geo:102'}, 'geo', '(language:en,country:US)')
+
+        # Verify that only the code which is not pending is requested
+        self.assertEqual(client.get.call_count, 1)
+        self.assertIn('List(101)', client.get.call_args[1]['url'])
+        self.assertEqual(resolved, {'101': 'United States', '102': 'France'})
+
+    @parameterized.expand([
+        ['titles', 'en_US', 'https://api.linkedin.com/v2/titles?ids=List(101)&locale=en_US'],
+        ['geo', '(language:en,country:US)', 'https://api.linkedin.com/v2/geo?ids=List(101)&locale=(language:en,country:US)'],
+        ['industries', 'en_US', 'https://api.linkedin.com/v2/industries?ids=List(101)&locale=(language:en,country:US)'],
+        ['organizations', None, 'https://api.linkedin.com/rest/organizationsLookup?ids=List(101)'],
+        ['functions', 'en_US', 'https://api.linkedin.com/v2/functions?locale=en_US'],
+        ['seniorities', None, 'https://api.linkedin.com/v2/seniorities'],
+    ])
+    def test_resolve_urns_url(self, endpoint, locale, expected_url):
+        """
+        Test that each endpoint is requested with its URL.
+        """
+        client = mock.Mock()
+        client.get.return_value = {}
+
+        resolve_urns(client, {'urn:li:{}:101'.format(endpoint)}, endpoint, locale)
+
+        client.get.assert_called_once_with(url=expected_url, endpoint=endpoint,
+                                           headers={'X-Restli-Protocol-Version': '2.0.0'})
+
+    @mock.patch('requests.Session.request')
+    def test_resolve_urns_does_not_change_headers(self, mock_request):
+        """
+        Test that the headers added by the client to a request are not kept in the shared resolver headers.
+        """
+        mock_request.return_value = mock.Mock(status_code=200, content=b'{"results": {}}')
+        client = LinkedinClient('client_id', 'client_secret', 'refresh_token', 'access_token', 'accounts', 'config_path')
+
+        resolve_urns(client, {'urn:li:geo:101'}, 'geo', '(language:en,country:US)')
+
+        self.assertEqual(mock_request.call_args[1]['headers']['Authorization'], 'Bearer access_token')
+        self.assertEqual(dict(urn_resolver.HEADERS), {'X-Restli-Protocol-Version': '2.0.0'})
+
+    @parameterized.expand([
+        ['titles', {'results': {'101': {'name': {'default': 'Engineer'}}}}, 'Engineer'],
+        ['industries', {'results': {'101': {'name': {'localized': {'en_US': 'Banking'}}}}}, 'Banking'],
+        ['organizations', {'results': {'101': {'localizedName': 'Acme'}}}, 'Acme'],
+        ['functions', {'elements': [{'id': 101, 'name': {'localized': {'en_US': 'Sales'}}},
+                                    {'id': 102, 'name': {'localized': {'en_US': 'Legal'}}}]}, 'Sales'],
+    ])
+    def test_resolve_urns_names(self, endpoint, response, expected_name):
+        """
+        Test that the name of the code is read from the response of each endpoint.
+        """
+        client = mock.Mock()
+        client.get.return_value = response
+
+        resolved = resolve_urns(client, {'urn:li:{}:101'.format(endpoint)}, endpoint)
+
+        self.assertEqual(resolved, {'101': expected_name})
+
+    def test_resolve_urns_in_chunks(self):
+        """
+        Test that codes are requested in chunks of 150 and the names of all chunks are returned.
+        """
+        def get(url, endpoint, headers):
+            ids = url.split('List(')[1].split(')')[0].split(',')
+            return {'results': {code: {'defaultLocalizedName': {'value': 'geo ' + code}} for code in ids}}
+
+        client = mock.Mock()
+        client.get.side_effect = get
+        urns = {'urn:li:geo:{}'.format(code) for code in range(301)}
+
+        resolved = resolve_urns(client, urns, 'geo')
+
+        self.assertEqual(client.get.call_count, 3)
+        self.assertEqual(resolved, {str(code): 'geo {}'.format(code) for code in range(301)})
+
+    def test_resolve_urns_caches_enumerations(self):
+        """
+        Test that all the codes of an enumeration are cached by its first request.
+        """
+        client = mock.Mock()
+        client.get.return_value = {'elements': [{'id': 101, 'name': {'localized': {'en_US': 'Sales'}}},
+                                                {'id': 102, 'name': {'localized': {'en_US': 'Legal'}}}]}
+
+        first = resolve_urns(client, {'urn:li:function:101'}, 'functions', 'en_US')
+        second = resolve_urns(client, {'urn:li:function:102'}, 'functions', 'en_US')
+
+        # Verify that the second code is served from the cache
+        self.assertEqual(client.get.call_count, 1)
+        self.assertEqual(first, {'101': 'Sales'})
+        self.assertEqual(second, {'102': 'Legal'})
+
+    @parameterized.expand([
+        ['functions'], ['titles'], ['geo'], ['industries'], ['organizations'], ['seniorities'],
+    ])
+    def test_resolver_has_no_instance_dict(self, endpoint):
+        """
+        Test that the resolvers only have the attributes declared in their slots.
+        """
+        resolver = urn_resolver.URNResolverFactory.create_resolver(endpoint, mock.Mock())
+
+        self.assertFalse(hasattr(resolver, '__dict__'))
+
+    def test_resolve_urns_skips_elements_without_id(self):
+        """
+        Test that the elements of an enumeration without an id are not cached.
+        """
+        client = mock.Mock()
+        client.get.return_value = {'elements': [{'name': {'localized': {'en_US': 'Unknown'}}},
+                                                {'id': 101, 'name': {'localized': {'en_US': 'Sales'}}}]}
+
+        resolved = resolve_urns(client, {'urn:li:function:101'}, 'functions', 'en_US')
+
+        self.assertEqual(resolved, {'101': 'Sales'})
+        self.assertEqual(dict(URN_CACHE[('functions', 'en_US')]), {'101': 'Sales'})
+
+
+    def test_resolve_urns_unsupported_endpoint(self):
+        """
+        Test that an endpoint without a resolver raises a ValueError.
+        """
+        with self.assertRaises(ValueError) as e:
+            resolve_urns(mock.Mock(), {'urn:li:skill:101'}, 'skills')
+
+        self.assertEqual(str(e.exception), 'Unsupported endpoint: skills')